@@ -0,0 +1,59 @@
+import argparse
+import importlib
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+PAGES_DIR = BASE_DIR / 'tests' / 'fixture_data' / 'pages'
+sys.path.append(str(BASE_DIR / 'src'))
+
+main = importlib.import_module('main')
+utils = importlib.import_module('utils')
+
+PAGES = (
+    ('whats-new index', 'whatsnew_index.html', main.WHATS_NEW_INDEX_SPEC),
+    ('whats-new page', 'whatsnew_3.12.html', main.WHATS_NEW_PAGE_SPEC),
+    ('latest-versions', 'docs_index.html', main.LATEST_VERSIONS_SPEC),
+    ('download', 'download.html', main.DOWNLOAD_SPEC),
+    ('pep index', 'pep_index.html', main.PEP_INDEX_SPEC),
+    ('pep card', 'pep-0003.html', dict(name='abbr')),
+)
+HEADER = '{:<16} {:>10} {:>10} {:>8} {:>11} {:>11} {:>8}'
+ROW = '{:<16} {:>10.2f} {:>10.2f} {:>7.1f}x {:>11} {:>11} {:>7.1f}x'
+
+
+def measure(text, parse_only, repeat):
+    utils.make_soup(text, parse_only=parse_only)
+    tracemalloc.start()
+    utils.make_soup(text, parse_only=parse_only)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        utils.make_soup(text, parse_only=parse_only)
+    return (time.perf_counter() - start) / repeat * 1000, peak // 1024
+
+
+def main_bench(repeat):
+    print(HEADER.format(
+        'page', 'full, ms', 'spec, ms', 'speedup',
+        'full, KiB', 'spec, KiB', 'memory'
+    ))
+    for name, filename, spec in PAGES:
+        text = (PAGES_DIR / filename).read_text(encoding='utf-8')
+        full_time, full_peak = measure(text, None, repeat)
+        spec_time, spec_peak = measure(text, spec, repeat)
+        print(ROW.format(
+            name, full_time, spec_time, full_time / spec_time,
+            full_peak, spec_peak, full_peak / spec_peak
+        ))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Разбор сохранённых страниц целиком и по спецификации'
+    )
+    parser.add_argument('-n', '--repeat', type=int, default=20)
+    main_bench(parser.parse_args().repeat)
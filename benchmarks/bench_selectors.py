@@ -0,0 +1,64 @@
+import argparse
+import importlib
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+PAGES_DIR = BASE_DIR / 'tests' / 'fixture_data' / 'pages'
+sys.path.append(str(BASE_DIR / 'src'))
+
+main = importlib.import_module('main')
+utils = importlib.import_module('utils')
+backends = importlib.import_module('backends')
+
+HEADER = '{:<24} {:>10}'
+ROW = '{:<24} {:>10.2f}'
+
+
+def soup_string_rows(text):
+    soup = utils.make_soup(text, parse_only=main.PEP_INDEX_SPEC)
+    section = utils.find_tag(
+        soup, 'section', attrs={'id': 'index-by-category'}
+    )
+    return [
+        (utils.find_tag(row, 'abbr').text, utils.find_tag(row, 'a')['href'])
+        for table in section.find_all('table')
+        for row in table.select('tbody tr')
+    ]
+
+
+def backend_rows(backend, text):
+    page = backend.parse(text, main.PEP_INDEX_SPEC)
+    return [
+        (backend.text(backend.find(row, 'abbr')),
+         backend.find(row, 'a').get('href'))
+        for row in backend.select(page, main.PEP_INDEX_ROWS)
+    ]
+
+
+VARIANTS = (
+    ('bs4 + select(str)', soup_string_rows),
+    ('bs4 backend', partial(backend_rows, backends.BACKENDS['bs4'])),
+    ('lxml backend', partial(backend_rows, backends.BACKENDS['lxml'])),
+)
+
+
+def main_bench(repeat):
+    text = (PAGES_DIR / 'pep_index.html').read_text(encoding='utf-8')
+    print(HEADER.format('pep index', 'ms'))
+    for name, extract in VARIANTS:
+        extract(text)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            extract(text)
+        print(ROW.format(name, (time.perf_counter() - start) / repeat * 1000))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Извлечение строк индекса PEP разными селекторами'
+    )
+    parser.add_argument('-n', '--repeat', type=int, default=20)
+    main_bench(parser.parse_args().repeat)
@@ -0,0 +1,65 @@
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+IMPORT_TIME_PATTERN = re.compile(
+    r'import time:\s+(?P<own>\d+) \|\s+(?P<total>\d+) \| (?P<name>.+)'
+)
+COMMANDS = (
+    ('import main', [sys.executable, '-X', 'importtime', '-c', 'import main']),
+    ('main.py -h', [
+        sys.executable, '-X', 'importtime', '-c',
+        'import sys; sys.argv = ["main.py", "-h"]; import main; main.main()'
+    ]),
+)
+
+
+def measure(command):
+    start = time.perf_counter()
+    completed = subprocess.run(
+        command, cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+    wall = (time.perf_counter() - start) * 1000
+    imports = [
+        (match['name'].strip(), int(match['total']) / 1000)
+        for match in IMPORT_TIME_PATTERN.finditer(completed.stderr)
+    ]
+    main_import = next(
+        (total for name, total in imports if name == 'main'), 0.0
+    )
+    return wall, main_import, imports
+
+
+def main_bench(repeat, top, max_ms):
+    regressions = []
+    for name, command in COMMANDS:
+        runs = [measure(command) for _ in range(repeat)]
+        wall = statistics.median(run[0] for run in runs)
+        main_import = statistics.median(run[1] for run in runs)
+        print(f'{name:<12} wall {wall:>8.1f} ms  import main '
+              f'{main_import:>8.1f} ms')
+        slowest = sorted(runs[-1][2], key=lambda item: item[1])[-top:]
+        for module, total in reversed(slowest):
+            print(f'    {module:<40} {total:>8.1f} ms')
+        if max_ms is not None and main_import > max_ms:
+            regressions.append(name)
+    if regressions:
+        sys.exit('Импорт main дольше {} мс: {}'.format(
+            max_ms, ', '.join(regressions)
+        ))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Время запуска парсера по данным -X importtime'
+    )
+    parser.add_argument('-n', '--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--max-ms', type=float)
+    args = parser.parse_args()
+    main_bench(args.repeat, args.top, args.max_ms)
@@ -0,0 +1,185 @@
+import argparse
+import importlib
+import json
+import logging
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+
+import requests_mock
+from requests_cache import CachedSession
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+sys.path.extend([str(BASE_DIR), str(BASE_DIR / 'src')])
+
+MODES = ('whats-new', 'latest-versions', 'download', 'pep')
+ARCHIVE_PATTERN = re.compile(r'/archives/')
+ARCHIVE_SIZE = 4 * 1024 * 1024
+
+
+class ReplayAdapter(requests_mock.Adapter):
+    """Отдаёт синтетические страницы фикстур с заданной задержкой
+    и считает трафик."""
+
+    def __init__(self, pages, latency):
+        super().__init__()
+        self.latency = latency
+        self.bytes_served = 0
+        for url, body in pages.items():
+            self.register_uri(
+                'GET', url,
+                headers={'Content-Type': 'text/html; charset=utf-8'},
+                content=self.replay(body.encode('utf-8')),
+            )
+        archive = bytes(range(256)) * (ARCHIVE_SIZE // 256)
+        self.register_uri(
+            'GET', ARCHIVE_PATTERN, content=self.replay(archive),
+            headers={'ETag': '"archive"'},
+        )
+        self.register_uri(
+            'HEAD', ARCHIVE_PATTERN, headers={'ETag': '"archive"'}
+        )
+
+    def replay(self, body):
+        def callback(request, context):
+            time.sleep(self.latency)
+            self.bytes_served += len(body)
+            return body
+        return callback
+
+
+def run_single(mode, latency, workers, warm, processes=None):
+    main = importlib.import_module('main')
+    recorded = importlib.import_module('tests.fixture_data.recorded')
+    logging.disable(logging.CRITICAL)
+    main.METRICS.enabled = True
+    adapter = ReplayAdapter(recorded.recorded_pages(), latency)
+    session = CachedSession(backend='memory')
+    session.mount('https://', adapter)
+
+    pool = ProcessPoolExecutor(processes) if processes else nullcontext()
+    with tempfile.TemporaryDirectory() as tmp_dir, pool as parse_pool:
+        main.BASE_DIR = Path(tmp_dir)
+        run = partial(
+            main.MODE_TO_FUNCTION[mode], session,
+            workers=workers, parse_pool=parse_pool
+        )
+        if warm:
+            consume(run())
+            adapter.bytes_served = 0
+            adapter.reset()
+        main.METRICS.reset()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        consume(run())
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+
+    return {
+        'mode': mode,
+        'warm': warm,
+        'processes': processes,
+        'wall_time': round(wall, 4),
+        'cpu_time': round(cpu, 4),
+        'peak_rss_kib': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        'bytes_parsed': main.METRICS.counters['bytes_parsed'],
+        'bytes_served': adapter.bytes_served,
+        'requests': adapter.call_count,
+    }
+
+
+def consume(results):
+    if results is not None:
+        for _ in results:
+            pass
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(args):
+    runs = []
+    for mode in args.modes:
+        for warm in (False, True) if args.warm else (False,):
+            for _ in range(args.repeat):
+                command = [
+                    sys.executable, __file__, '--run-mode', mode,
+                    '--latency', str(args.latency),
+                    '--workers', str(args.workers),
+                ]
+                if args.processes:
+                    command.extend(['--processes', str(args.processes)])
+                if warm:
+                    command.append('--warm')
+                completed = subprocess.run(
+                    command, capture_output=True, text=True, check=True
+                )
+                runs.append(json.loads(completed.stdout))
+                print('{mode:<16} {state:<5} wall {wall_time:>8.3f} s  '
+                      'cpu {cpu_time:>8.3f} s  rss {peak_rss_kib:>8} KiB  '
+                      'parsed {bytes_parsed:>10} B  '
+                      'served {bytes_served:>10} B  {requests:>4} req'.format(
+                          state='warm' if warm else 'cold', **runs[-1]
+                      ))
+    return {
+        'commit': git_commit(),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'latency': args.latency,
+        'workers': args.workers,
+        'processes': args.processes,
+        'runs': runs,
+    }
+
+
+def configure_argument_parser():
+    parser = argparse.ArgumentParser(
+        description='Замеры режимов парсера на синтетических страницах '
+                    'фикстур'
+    )
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=MODES)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('-w', '--workers', type=int, default=1)
+    parser.add_argument('-p', '--processes', type=int)
+    parser.add_argument('-n', '--repeat', type=int, default=1)
+    parser.add_argument('--warm', action='store_true')
+    parser.add_argument('-o', '--output', type=Path)
+    parser.add_argument('--run-mode', choices=MODES, help=argparse.SUPPRESS)
+    return parser
+
+
+def main():
+    args = configure_argument_parser().parse_args()
+    if args.run_mode:
+        print(json.dumps(run_single(
+            args.run_mode, args.latency, args.workers, args.warm,
+            args.processes
+        )))
+        return
+    report = run_suite(args)
+    output = args.output or RESULTS_DIR / '{}_{}.json'.format(
+        report['commit'] or 'worktree',
+        datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+    print(f'Результаты сохранены: {output}')
+
+
+if __name__ == '__main__':
+    main()
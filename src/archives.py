@@ -0,0 +1,144 @@
+import base64
+import hashlib
+import re
+from http import HTTPStatus
+
+from constants import (DOWNLOAD_CHUNK_SIZE, ETAG_SUFFIX, NO_STORE,
+                       PART_SUFFIX)
+from exceptions import DownloadError
+
+SIZE_MISMATCH = "Размер архива {path}: {size} байт, ожидалось {expected}"
+CHECKSUM_MISMATCH = "Контрольная сумма архива {path} не совпадает с Digest"
+DOWNLOAD_FAILED = "Не удалось загрузить архив {url}: {exc}"
+CONTENT_RANGE_PATTERN = r"bytes \d+-\d+/(?P<total>\d+)"
+DIGEST_PATTERN = r"sha-256=(?P<digest>[A-Za-z0-9+/=]+)"
+
+
+def expected_size(response, offset):
+    if match := re.match(
+        CONTENT_RANGE_PATTERN, response.headers.get("Content-Range", "")
+    ):
+        return int(match["total"])
+    if length := response.headers.get("Content-Length"):
+        return offset + int(length)
+    return None
+
+
+def expected_digest(response):
+    if match := re.search(
+        DIGEST_PATTERN, response.headers.get("Digest", ""), re.IGNORECASE
+    ):
+        return base64.b64decode(match["digest"])
+    return None
+
+
+def hash_file(path, digest, chunk_size=DOWNLOAD_CHUNK_SIZE):
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+
+
+def resume_validator(response):
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def request_archive(session, url, offset, validator=None):
+    from requests import RequestException
+    headers = dict(NO_STORE)
+    if offset:
+        headers.update({"Range": f"bytes={offset}-", "If-Range": validator})
+    try:
+        response = session.get(url, headers=headers, stream=True)
+        if offset and response.status_code == (
+            HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+        ):
+            response.close()
+            return request_archive(session, url, 0)
+        response.raise_for_status()
+    except RequestException as exc:
+        raise ConnectionError(
+            DOWNLOAD_FAILED.format(url=url, exc=exc)
+        ) from exc
+    return response
+
+
+def is_up_to_date(session, url, path):
+    from requests import RequestException
+    if not path.exists():
+        return False
+    try:
+        response = session.head(
+            url, headers=NO_STORE, allow_redirects=True
+        )
+        response.raise_for_status()
+    except RequestException as exc:
+        raise ConnectionError(
+            DOWNLOAD_FAILED.format(url=url, exc=exc)
+        ) from exc
+    etag_path = path.with_name(path.name + ETAG_SUFFIX)
+    if etag := response.headers.get("ETag"):
+        return etag_path.exists() and etag_path.read_text() == etag
+    length = response.headers.get("Content-Length")
+    return length is not None and int(length) == path.stat().st_size
+
+
+def download_archive(session, url, path, chunk_size=DOWNLOAD_CHUNK_SIZE,
+                     bandwidth=None):
+    """Потоково загружает архив во временный файл с докачкой по Range,
+    проверяет размер и контрольную сумму (если сервер прислал Digest)
+    и атомарно переименовывает.
+
+    Докачка возможна, только если рядом с временным файлом сохранён
+    валидатор ответа (ETag или Last-Modified): он отправляется в If-Range,
+    и изменившийся на сервере архив загружается заново с начала."""
+    from tqdm import tqdm
+    part_path = path.with_name(path.name + PART_SUFFIX)
+    validator_path = part_path.with_name(part_path.name + ETAG_SUFFIX)
+    offset = 0
+    validator = None
+    if part_path.exists() and validator_path.exists():
+        offset = part_path.stat().st_size
+        validator = validator_path.read_text()
+    response = request_archive(session, url, offset, validator)
+    if response.status_code != HTTPStatus.PARTIAL_CONTENT:
+        offset = 0
+        if validator := resume_validator(response):
+            validator_path.write_text(validator)
+        else:
+            validator_path.unlink(missing_ok=True)
+    total = expected_size(response, offset)
+    digest = hashlib.sha256()
+    if offset:
+        hash_file(part_path, digest, chunk_size)
+
+    progress = tqdm(
+        total=total, initial=offset, unit="B", unit_scale=True,
+        desc=path.name, disable=None
+    )
+    with response, progress, open(part_path, "ab" if offset else "wb") as f:
+        for chunk in response.iter_content(chunk_size):
+            if bandwidth is not None:
+                bandwidth.acquire(len(chunk))
+            f.write(chunk)
+            digest.update(chunk)
+            progress.update(len(chunk))
+
+    size = part_path.stat().st_size
+    if total is not None and size != total:
+        raise DownloadError(
+            SIZE_MISMATCH.format(path=part_path, size=size, expected=total)
+        )
+    if (checksum := expected_digest(response)) is not None and (
+        checksum != digest.digest()
+    ):
+        part_path.unlink()
+        validator_path.unlink(missing_ok=True)
+        raise DownloadError(CHECKSUM_MISMATCH.format(path=part_path))
+    part_path.replace(path)
+    validator_path.unlink(missing_ok=True)
+    if etag := response.headers.get("ETag"):
+        path.with_name(path.name + ETAG_SUFFIX).write_text(etag)
+    return digest.hexdigest()
@@ -0,0 +1,230 @@
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+from constants import (DEFAULT_RETRIES, DEFAULT_TIMEOUT, RETRY_BACKOFF_FACTOR,
+                       RETRY_STATUSES)
+from parse_pool import parse_body
+from utils import RESPONSE_ERROR, count_response
+
+AIOHTTP_REQUIRED = "Для асинхронного движка установите пакет aiohttp"
+
+
+def import_aiohttp():
+    try:
+        import aiohttp
+    except ImportError as exc:
+        raise RuntimeError(AIOHTTP_REQUIRED) from exc
+    return aiohttp
+
+
+def make_response(request, url, status, reason, headers, body):
+    from requests import Response
+    from requests.structures import CaseInsensitiveDict
+    from urllib3 import HTTPResponse
+    response = Response()
+    response.headers = CaseInsensitiveDict(headers)
+    response.raw = HTTPResponse(
+        body=io.BytesIO(body),
+        headers=response.headers,
+        status=status,
+        reason=reason,
+        preload_content=False,
+        decode_content=False,
+        request_url=url,
+    )
+    response.status_code = status
+    response.reason = reason
+    response.url = url
+    response.request = request
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+class AsyncClient:
+    """Асинхронный HTTP-клиент поверх HTTP-кеша сессии requests_cache.
+
+    Ключи, сроки жизни и условные запросы к устаревшим записям считаются
+    по настройкам сессии, поэтому оба движка читают и пополняют одно
+    хранилище. Число запросов в полёте ограничено семафором, обращения
+    к хранилищу и разбор страниц выполняются в пуле потоков.
+    """
+
+    def __init__(self, session, concurrency, workers=1,
+                 timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                 rate_limit=None):
+        self.session = session
+        self.concurrency = concurrency
+        self.workers = workers
+        self.timeout = timeout
+        self.retries = retries
+        self.rate_limit = rate_limit
+        self.cache_enabled = True
+        self._buckets = {}
+        self._background = set()
+
+    async def __aenter__(self):
+        aiohttp = import_aiohttp()
+        self.loop = asyncio.get_running_loop()
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        self.errors = (aiohttp.ClientError, asyncio.TimeoutError)
+        self.http = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            connector=aiohttp.TCPConnector(limit=self.concurrency),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.gather(*self._background, return_exceptions=True)
+        await self.http.close()
+        self.executor.shutdown()
+
+    @contextmanager
+    def cache_disabled(self):
+        self.cache_enabled = False
+        try:
+            yield
+        finally:
+            self.cache_enabled = True
+
+    def run(self, func, *args):
+        return self.loop.run_in_executor(self.executor, func, *args)
+
+    async def get(self, url, encoding="utf-8", headers=None):
+        from requests import Request
+        request = self.session.prepare_request(
+            Request("GET", url, headers=headers)
+        )
+        if self.cache_enabled:
+            response = await self.send_cached(request)
+        else:
+            response = await self.send(request)
+        response.encoding = encoding
+        count_response(response, False)
+        return response
+
+    async def send_cached(self, request):
+        from requests_cache.policy import CacheActions
+        actions = CacheActions.from_request(
+            self.session.cache.create_key(request),
+            request,
+            self.session.settings
+        )
+        cached_response = None
+        if not actions.skip_read:
+            cached_response = await self.run(
+                self.session.cache.get_response, actions.cache_key
+            )
+        actions.update_from_cached_response(
+            cached_response, self.session.cache.create_key
+        )
+        if actions.resend_async:
+            task = asyncio.create_task(
+                self.send_and_cache(request, actions, cached_response)
+            )
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+        elif actions.send_request or actions.resend_request:
+            return await self.send_and_cache(
+                request, actions, cached_response
+            )
+        return cached_response
+
+    async def send_and_cache(self, request, actions, cached_response=None):
+        request = actions.update_request(request)
+        response = await self.send(request)
+        actions.update_from_response(response)
+        if not actions.skip_write:
+            await self.save(response, actions)
+            return response
+        if (
+            cached_response is None
+            or response.status_code != HTTPStatus.NOT_MODIFIED
+        ):
+            return response
+        cached_response = actions.update_revalidated_response(
+            response, cached_response
+        )
+        # Ответ 304 сам не сохраняется; update_revalidated_response заново
+        # решает, нужна ли запись: только если изменились срок жизни
+        # или заголовки закешированного ответа.
+        revalidated_changed = not actions.skip_write
+        if revalidated_changed:
+            await self.save(cached_response, actions)
+        return cached_response
+
+    async def save(self, response, actions):
+        await self.run(
+            self.session.cache.save_response,
+            response, actions.cache_key, actions.expires
+        )
+
+    async def send(self, request):
+        headers = {
+            name: value for name, value in request.headers.items()
+            if name.lower() != "accept-encoding"
+        }
+        async with self.semaphore:
+            for attempt in range(self.retries + 1):
+                await self.throttle(request.url)
+                try:
+                    async with self.http.get(
+                        request.url, headers=headers
+                    ) as http_response:
+                        body = await http_response.read()
+                except self.errors as exc:
+                    if attempt == self.retries:
+                        raise ConnectionError(RESPONSE_ERROR.format(
+                            url=request.url, exc=exc
+                        )) from exc
+                else:
+                    if (http_response.status not in RETRY_STATUSES
+                            or attempt == self.retries):
+                        return make_response(
+                            request,
+                            str(http_response.url),
+                            http_response.status,
+                            http_response.reason,
+                            http_response.headers,
+                            body
+                        )
+                await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2 ** attempt)
+
+    async def throttle(self, url):
+        if not self.rate_limit:
+            return
+        host = urlsplit(url).netloc
+        if host not in self._buckets:
+            from transport import TokenBucket
+            self._buckets[host] = TokenBucket(self.rate_limit)
+        if delay := self._buckets[host].reserve():
+            await asyncio.sleep(delay)
+
+    async def parse(self, response, parse, parse_cache=None,
+                    parse_pool=None):
+        if parse_cache is not None:
+            return await self.run(
+                parse_cache.get_or_parse, response, parse, parse_pool
+            )
+        if parse_pool is not None:
+            return await self.loop.run_in_executor(
+                parse_pool, parse_body,
+                parse, response.url, response.content, response.encoding
+            )
+        return await self.run(parse, response)
+
+    async def get_parsed(self, url, parse, parse_cache=None,
+                         parse_pool=None, **kwargs):
+        response = await self.get(url, **kwargs)
+        return await self.parse(response, parse, parse_cache, parse_pool)
+
+    async def map_ordered(self, func, items):
+        tasks = [asyncio.ensure_future(func(item)) for item in items]
+        if tasks:
+            await asyncio.wait(tasks)
+        return tasks
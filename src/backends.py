@@ -0,0 +1,88 @@
+from constants import DEFAULT_PARSER_BACKEND
+from exceptions import ParserFindTagException
+from metrics import METRICS
+from utils import (TAG_NOT_FOUND, find_tag, make_soup, make_tree, select,
+                   select_one)
+
+PARSE_ERROR = "Не удалось разобрать страницу: {exc}"
+
+
+class SoupBackend:
+    """Разбор страниц через BeautifulSoup.
+
+    Поддерживает частичный разбор по спецификации SoupStrainer.
+    """
+
+    def parse(self, text, parse_only=None):
+        return make_soup(text, parse_only=parse_only)
+
+    def find(self, node, tag, attrs=None):
+        return find_tag(node, tag, attrs)
+
+    def find_all(self, node, tag):
+        return node.find_all(tag)
+
+    def select(self, node, selector):
+        return select(node, selector)
+
+    def select_one(self, node, selector):
+        return select_one(node, selector)
+
+    def text(self, node):
+        return node.text
+
+
+def has_attrs(element, attrs):
+    for name, value in attrs.items():
+        actual = element.get(name)
+        if actual is None:
+            return False
+        if name == "class" and value not in actual.split():
+            return False
+        if name != "class" and actual != value:
+            return False
+    return True
+
+
+class LxmlBackend:
+    """Разбор страниц напрямую в дерево lxml.html без обёрток bs4.
+
+    Спецификация частичного разбора игнорируется: дерево строится целиком.
+    """
+
+    def parse(self, text, parse_only=None):
+        from lxml import etree
+        try:
+            return make_tree(text)
+        except (etree.LxmlError, ValueError) as exc:
+            raise ParserFindTagException(
+                PARSE_ERROR.format(exc=exc)
+            ) from exc
+
+    @METRICS.timed_function("find_tag")
+    def find(self, node, tag, attrs=None):
+        for element in node.iterdescendants(tag):
+            if has_attrs(element, attrs or {}):
+                return element
+        raise ParserFindTagException(
+            TAG_NOT_FOUND.format(tag=tag, message_attrs=attrs or None)
+        )
+
+    def find_all(self, node, tag):
+        return list(node.iterdescendants(tag))
+
+    def select(self, node, selector):
+        return select(node, selector)
+
+    def select_one(self, node, selector):
+        return select_one(node, selector)
+
+    def text(self, node):
+        return node.text_content()
+
+
+BACKENDS = {
+    "lxml": LxmlBackend(),
+    "bs4": SoupBackend(),
+}
+DEFAULT_BACKEND = BACKENDS[DEFAULT_PARSER_BACKEND]
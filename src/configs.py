@@ -2,9 +2,99 @@ import argparse
 import logging
 from logging.handlers import RotatingFileHandler
 
-from constants import LOG_DIR, LOG_FILE, OUTPUT_FILE, OUTPUT_PRETTY
+from constants import (BASE_DIR, CACHE_BACKENDS, DEFAULT_CONCURRENCY,
+                       DEFAULT_DOWNLOAD_FORMATS, DEFAULT_PARSER_BACKEND,
+                       DEFAULT_PEP_REPORT, DEFAULT_RETRIES,
+                       DEFAULT_TIMEOUT, DEFAULT_WORKERS, DOWNLOAD_FORMATS,
+                       ENGINE_THREADS, ENGINES, HTTP_CACHE_NAME, LOG_DIR,
+                       LOG_FILE, METRICS_FORMATS,
+                       NEVER_EXPIRE, OUTPUT_COMPRESSIONS,
+                       OUTPUT_TO_COMPRESSIONS, OUTPUTS,
+                       PARSE_CACHE_SIZE, PARSER_BACKENDS, PEP_QUERIES,
+                       PEP_REPORTS, PROFILE_TOP,
+                       REFRESH_INTERVAL,
+                       SERVER_HOST, SERVER_PORT, URLS_EXPIRE_AFTER)
 
 OUTPUT_HELP = "Дополнительные способы вывода данных"
+COMPRESSION_HELP = (
+    "Сжатие для форматов jsonl (gzip), arrow (zstd, lz4) "
+    "и parquet (gzip, zstd, lz4, snappy, brotli)"
+)
+WORKERS_HELP = "Количество параллельных загрузок страниц"
+INCREMENTAL_HELP = (
+    "Инкрементальный режим pep: повторно разбираются только изменившиеся "
+    "карточки"
+)
+PARSE_CACHE_HELP = (
+    "Максимальное число записей в кеше результатов разбора (0 — отключить)"
+)
+CACHE_BACKEND_HELP = "Хранилище HTTP-кеша"
+EXPIRE_AFTER_HELP = (
+    "Срок жизни HTTP-кеша в секундах для остальных адресов "
+    "(-1 — бессрочно)"
+)
+EXPIRE_HELP = (
+    "Срок жизни кеша для адресов по шаблону, например "
+    "peps.python.org/pep-*=86400; можно указать несколько раз"
+)
+STALE_HELP = (
+    "Отдавать устаревший ответ из кеша и обновлять его в фоне"
+)
+TIMEOUT_HELP = "Таймаут запроса в секундах"
+RETRIES_HELP = "Число повторов запроса при сетевых ошибках и ответах 429/5xx"
+RATE_LIMIT_HELP = "Максимум запросов в секунду к одному хосту"
+FORMATS_HELP = "Форматы архивов документации для режима download"
+BANDWIDTH_HELP = "Общее ограничение скорости загрузки архивов, КиБ/с"
+SERVE_HELP = (
+    "Запустить HTTP-сервер, который отдаёт результаты выбранных режимов "
+    "в JSON и периодически обновляет их"
+)
+HOST_HELP = "Адрес HTTP-сервера"
+PORT_HELP = "Порт HTTP-сервера"
+REFRESH_INTERVAL_HELP = "Интервал фонового обновления данных сервера, секунд"
+METRICS_HELP = (
+    "Замерить время этапов и счётчики кеша; по окончании вывести таблицу "
+    "или сохранить отчёт в JSON или текстовом формате Prometheus"
+)
+PROFILE_HELP = (
+    "Выполнить режимы под cProfile: сохранить статистику в src/profiles "
+    "и вывести сводку по подсистемам"
+)
+PROFILE_TOP_HELP = "Число самых затратных функций в сводке профилировщика"
+BACKEND_HELP = (
+    "Библиотека разбора HTML: lxml.html (быстрее) или BeautifulSoup"
+)
+PROCESSES_HELP = (
+    "Разбирать загруженные страницы в пуле из указанного числа процессов; "
+    "число потоков загрузки увеличивается до числа процессов"
+)
+PEP_INDEX_HELP = (
+    "Сохранять данные о каждом PEP в локальный индекс SQLite"
+)
+QUERY_HELP = (
+    "Ответить на запрос по локальному индексу PEP без загрузки страниц: "
+    "mismatched — PEP с несовпадающими статусами, counts — количество "
+    "по статусу и типу"
+)
+REPORT_HELP = (
+    "Отчёт режима pep: statuses — количество по статусам, confusion — "
+    "статусы в индексе против статусов в карточках, categories — статусы "
+    "по категориям"
+)
+ENGINE_HELP = (
+    "Движок загрузки для режимов whats-new и pep: пул потоков или asyncio "
+    "(нужен пакет aiohttp)"
+)
+CONCURRENCY_HELP = (
+    "Максимум одновременных запросов асинхронного движка"
+)
+BAD_COMPRESSION = (
+    "Сжатие {compression} не поддерживается форматом {output}, "
+    "допустимые значения: {allowed}"
+)
+BAD_EXPIRE_RULE = "Ожидается правило вида ШАБЛОН=СЕКУНДЫ, получено: {value}"
+NOT_POSITIVE = "Ожидается целое число больше нуля, получено: {value}"
+NEGATIVE = "Ожидается неотрицательное целое число, получено: {value}"
 
 LOG_FORMAT = '%(asctime)s - [%(levelname)s] - %(message)s'
 DT_FORMAT = '%d.%m.%Y %H:%M:%S'
@@ -13,10 +103,35 @@ MAX_LOG_BYTES = 10 ** 6
 BACKUP_COUNT = 5
 
 
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(NOT_POSITIVE.format(value=value))
+    return number
+
+
+def non_negative_int(value):
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(NEGATIVE.format(value=value))
+    return number
+
+
+def expire_rule(value):
+    pattern, separator, seconds = value.rpartition('=')
+    if separator and pattern:
+        try:
+            return pattern, int(seconds)
+        except ValueError:
+            pass
+    raise argparse.ArgumentTypeError(BAD_EXPIRE_RULE.format(value=value))
+
+
 def configure_argument_parser(available_modes):
     parser = argparse.ArgumentParser(description='Парсер документации Python')
     parser.add_argument(
         'mode',
+        nargs='+',
         choices=available_modes,
         help='Режимы работы парсера'
     )
@@ -29,12 +144,205 @@ def configure_argument_parser(available_modes):
     parser.add_argument(
         '-o',
         '--output',
-        choices=(OUTPUT_PRETTY, OUTPUT_FILE),
+        choices=OUTPUTS,
         help=OUTPUT_HELP
     )
+    parser.add_argument(
+        '--compression',
+        choices=OUTPUT_COMPRESSIONS,
+        help=COMPRESSION_HELP
+    )
+    parser.add_argument(
+        '-w',
+        '--workers',
+        type=positive_int,
+        default=DEFAULT_WORKERS,
+        help=WORKERS_HELP
+    )
+    parser.add_argument(
+        '-i',
+        '--incremental',
+        action='store_true',
+        help=INCREMENTAL_HELP
+    )
+    parser.add_argument(
+        '--parse-cache-size',
+        type=non_negative_int,
+        default=PARSE_CACHE_SIZE,
+        help=PARSE_CACHE_HELP
+    )
+    parser.add_argument(
+        '--cache-backend',
+        choices=CACHE_BACKENDS,
+        default=CACHE_BACKENDS[0],
+        help=CACHE_BACKEND_HELP
+    )
+    parser.add_argument(
+        '--expire-after',
+        type=int,
+        default=NEVER_EXPIRE,
+        help=EXPIRE_AFTER_HELP
+    )
+    parser.add_argument(
+        '--expire',
+        type=expire_rule,
+        action='append',
+        default=[],
+        help=EXPIRE_HELP
+    )
+    parser.add_argument(
+        '--stale-while-revalidate',
+        action='store_true',
+        help=STALE_HELP
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=TIMEOUT_HELP
+    )
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=DEFAULT_RETRIES,
+        help=RETRIES_HELP
+    )
+    parser.add_argument(
+        '--rate-limit',
+        type=float,
+        help=RATE_LIMIT_HELP
+    )
+    parser.add_argument(
+        '--formats',
+        nargs='+',
+        choices=DOWNLOAD_FORMATS,
+        default=DEFAULT_DOWNLOAD_FORMATS,
+        help=FORMATS_HELP
+    )
+    parser.add_argument(
+        '--bandwidth-limit',
+        type=float,
+        help=BANDWIDTH_HELP
+    )
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help=SERVE_HELP
+    )
+    parser.add_argument(
+        '--host',
+        default=SERVER_HOST,
+        help=HOST_HELP
+    )
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=SERVER_PORT,
+        help=PORT_HELP
+    )
+    parser.add_argument(
+        '--refresh-interval',
+        type=positive_int,
+        default=REFRESH_INTERVAL,
+        help=REFRESH_INTERVAL_HELP
+    )
+    parser.add_argument(
+        '--metrics',
+        choices=METRICS_FORMATS,
+        help=METRICS_HELP
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help=PROFILE_HELP
+    )
+    parser.add_argument(
+        '--profile-top',
+        type=positive_int,
+        default=PROFILE_TOP,
+        help=PROFILE_TOP_HELP
+    )
+    parser.add_argument(
+        '--backend',
+        choices=PARSER_BACKENDS,
+        default=DEFAULT_PARSER_BACKEND,
+        help=BACKEND_HELP
+    )
+    parser.add_argument(
+        '--processes',
+        type=positive_int,
+        help=PROCESSES_HELP
+    )
+    parser.add_argument(
+        '--pep-index',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=PEP_INDEX_HELP
+    )
+    parser.add_argument(
+        '--query',
+        choices=PEP_QUERIES,
+        help=QUERY_HELP
+    )
+    parser.add_argument(
+        '--report',
+        choices=PEP_REPORTS,
+        default=DEFAULT_PEP_REPORT,
+        help=REPORT_HELP
+    )
+    parser.add_argument(
+        '--engine',
+        choices=ENGINES,
+        default=ENGINE_THREADS,
+        help=ENGINE_HELP
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=positive_int,
+        default=DEFAULT_CONCURRENCY,
+        help=CONCURRENCY_HELP
+    )
     return parser
 
 
+def validate_args(parser, args):
+    if args.processes:
+        args.workers = max(args.workers, args.processes)
+    allowed = OUTPUT_TO_COMPRESSIONS.get(args.output)
+    if args.compression and allowed and args.compression not in allowed:
+        parser.error(BAD_COMPRESSION.format(
+            compression=args.compression,
+            output=args.output,
+            allowed=", ".join(allowed)
+        ))
+    return args
+
+
+def configure_session(args):
+    import requests_cache
+
+    from transport import RateLimitedAdapter
+    urls_expire_after = dict(args.expire)
+    for pattern, expire_after in URLS_EXPIRE_AFTER.items():
+        urls_expire_after.setdefault(pattern, expire_after)
+    session = requests_cache.CachedSession(
+        BASE_DIR / HTTP_CACHE_NAME,
+        backend=args.cache_backend,
+        expire_after=args.expire_after,
+        urls_expire_after=urls_expire_after,
+        stale_while_revalidate=args.stale_while_revalidate,
+    )
+    adapter = RateLimitedAdapter(
+        pool_size=args.workers,
+        timeout=args.timeout,
+        retries=args.retries,
+        rate_limit=args.rate_limit,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
 def configure_logging():
     LOG_DIR.mkdir(exist_ok=True)
     rotating_handler = RotatingFileHandler(
@@ -8,6 +8,17 @@ LOG_DIR = BASE_DIR / "logs"
 LOG_FILE = LOG_DIR / "parser.log"
 RESULTS_DIR = "results"
 DOWNLOADS_DIR = "downloads"
+METRICS_DIR = "metrics"
+PROFILES_DIR = "profiles"
+PART_SUFFIX = ".part"
+ETAG_SUFFIX = ".etag"
+PEP_STATE_FILE = "pep_state.json"
+PEP_INDEX_FILE = "pep_index.sqlite3"
+PEP_QUERIES = ("mismatched", "counts")
+PEP_REPORTS = ("statuses", "confusion", "categories")
+DEFAULT_PEP_REPORT = "statuses"
+PARSE_CACHE_FILE = "parse_cache.pickle"
+HTTP_CACHE_NAME = "http_cache"
 
 DATETIME_FORMAT = "%Y-%m-%d_%H-%M-%S"
 
@@ -21,5 +32,65 @@ EXPECTED_STATUS = {
     "W": ("Withdrawn",),
     "": ("Draft", "Active"),
 }
+MODE_ALL = "all"
+
 OUTPUT_PRETTY = "pretty"
 OUTPUT_FILE = "file"
+OUTPUT_JSONL = "jsonl"
+OUTPUT_ARROW = "arrow"
+OUTPUT_PARQUET = "parquet"
+OUTPUTS = (OUTPUT_PRETTY, OUTPUT_FILE, OUTPUT_JSONL, OUTPUT_ARROW,
+           OUTPUT_PARQUET)
+OUTPUT_COMPRESSIONS = ("gzip", "zstd", "lz4", "snappy", "brotli")
+OUTPUT_TO_COMPRESSIONS = {
+    OUTPUT_JSONL: ("gzip",),
+    OUTPUT_ARROW: ("zstd", "lz4"),
+    OUTPUT_PARQUET: OUTPUT_COMPRESSIONS,
+}
+OUTPUT_BATCH_SIZE = 1024
+
+METRICS_TABLE = "table"
+METRICS_JSON = "json"
+METRICS_PROMETHEUS = "prometheus"
+METRICS_FORMATS = (METRICS_TABLE, METRICS_JSON, METRICS_PROMETHEUS)
+PROFILE_TOP = 20
+
+DEFAULT_WORKERS = 1
+ENGINE_THREADS = "threads"
+ENGINE_ASYNC = "async"
+ENGINES = (ENGINE_THREADS, ENGINE_ASYNC)
+DEFAULT_CONCURRENCY = 100
+PARSER_BACKENDS = ("lxml", "bs4")
+DEFAULT_PARSER_BACKEND = "lxml"
+PARSE_CACHE_SIZE = 4096
+PARSE_CACHE_VERSION = 3
+
+CACHE_BACKENDS = ("sqlite", "filesystem", "memory")
+NEVER_EXPIRE = -1
+URLS_EXPIRE_AFTER = {
+    "peps.python.org/pep-*": 7 * 24 * 60 * 60,
+    "peps.python.org/": 60 * 60,
+    "docs.python.org/": 24 * 60 * 60,
+}
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+NO_STORE = {"Cache-Control": "no-store"}
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_FORMATS = {
+    "pdf-a4": "pdf-a4.zip",
+    "pdf-letter": "pdf-letter.zip",
+    "html": "html.zip",
+    "text": "text.zip",
+    "texinfo": "texinfo.zip",
+    "epub": ".epub",
+}
+DEFAULT_DOWNLOAD_FORMATS = ["pdf-a4"]
+
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8000
+REFRESH_INTERVAL = 15 * 60
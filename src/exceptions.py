@@ -1,2 +1,6 @@
 class ParserFindTagException(Exception):
     """Вызывается, когда парсер не может найти тег."""
+
+
+class DownloadError(Exception):
+    """Вызывается, когда архив загружен не полностью или повреждён."""
@@ -1,16 +1,31 @@
 import logging
 import re
-from collections import defaultdict
+from argparse import Namespace
+from contextlib import nullcontext
+from functools import partial
+from http import HTTPStatus
 from urllib.parse import urljoin
 
-import requests_cache
-
-from configs import configure_argument_parser, configure_logging
-from constants import (BASE_DIR, DOWNLOADS_DIR, EXPECTED_STATUS, MAIN_DOC_URL,
-                       PEP_URL)
-from exceptions import ParserFindTagException
-from outputs import control_output
-from utils import find_tag, get_soup
+from archives import download_archive, is_up_to_date
+from backends import BACKENDS, DEFAULT_BACKEND
+from configs import (configure_argument_parser, configure_logging,
+                     configure_session, validate_args)
+from constants import (BASE_DIR, DEFAULT_DOWNLOAD_FORMATS,
+                       DEFAULT_PEP_REPORT, DEFAULT_WORKERS, DOWNLOAD_FORMATS,
+                       DOWNLOADS_DIR, ENGINE_ASYNC, EXPECTED_STATUS,
+                       MAIN_DOC_URL,
+                       MODE_ALL, NO_STORE, PARSE_CACHE_FILE, PEP_INDEX_FILE,
+                       PEP_STATE_FILE, PEP_URL)
+from exceptions import DownloadError, ParserFindTagException
+from metrics import METRICS
+from outputs import control_output, metrics_output, profile_output
+from parse_cache import ParseCache
+from pep_index import PepIndex
+from pep_state import PepState
+from pep_table import PepTable
+from records import PepRecord, VersionRow, WhatsNewRow
+from utils import (Selector, find_tag_in_stream, get_parsed, get_response,
+                   map_ordered)
 
 
 ERROR_MESSAGE = (
@@ -19,135 +34,496 @@ ERROR_MESSAGE = (
     "\n Статус в карточке: {pep_card_status} "
     "\n Ожидаемые статусы: {expected_status} \n "
 )
-DOWNLOAD_SAVED = "Архив был загружен и сохранён: {archive_path}"
+DOWNLOAD_SAVED = (
+    "Архив был загружен и сохранён: {archive_path} (SHA-256: {checksum})"
+)
+DOWNLOAD_SKIPPED = "Архив уже загружен и не изменился: {archive_path}"
+DOWNLOAD_ERROR = "Не удалось загрузить архив {url}: {exc}"
+ARCHIVE_NOT_FOUND = "Ссылка на архив формата {format} не найдена"
 VERSION_NOT_FOUND = "Список версий Python не найден"
 VERSION_PATTERN = r"Python (?P<version>\d\.\d+) \((?P<status>.*)\)"
 PARSER_START = "Парсер запущен!"
 ARGS = "Аргументы командной строки: {args}"
 PARSER_END = "Парсер завершил работу."
 ERROR = "Ошибка при выполнении парсера: {error}"
+MODE_ERROR = "Ошибка в режиме {mode}: {error}"
 WHATS_NEW_ERROR = "Не удалось обработать страницу нововведений {url}: {exc}"
 PEP_NO_TABLES = "Таблицы внутри секции 'index-by-category' не найдены"
 PEP_PROCESS_ERROR = "Не удалось обработать {pep_card_url}: {exc}"
+PEP_ROW_ERROR = "Строка индекса PEP {pep_card_url} пропущена: {exc}"
+PEP_UNCHANGED = "Карточек PEP без изменений: {count}"
+PEP_INDEX_UPDATED = "Изменено записей в индексе PEP: {count}"
 
+WHATS_NEW_HEADER = ("Ссылка на статью", "Заголовок", "Редактор, автор")
 
-def whats_new(session):
-    whats_new_url = urljoin(MAIN_DOC_URL, "whatsnew/")
-    soup = get_soup(session, whats_new_url)
-    results = [("Ссылка на статью", "Заголовок", "Редактор, автор")]
-    sections = soup.select(
-        '#what-s-new-in-python div.toctree-wrapper > ul > li.toctree-l1 > a'
+WHATS_NEW_INDEX_SPEC = dict(name="section", id="what-s-new-in-python")
+WHATS_NEW_PAGE_SPEC = dict(name=["h1", "dl"])
+LATEST_VERSIONS_SPEC = dict(
+    name="div", attrs={"class": "sphinxsidebarwrapper"}
+)
+DOWNLOAD_SPEC = dict(name="div", attrs={"role": "main"})
+PEP_INDEX_SPEC = dict(name="section", id="index-by-category")
+
+WHATS_NEW_LINKS = Selector(
+    "#what-s-new-in-python div.toctree-wrapper > ul > li.toctree-l1 > a",
+    "//*[@id='what-s-new-in-python']//div[contains(concat(' ', "
+    "normalize-space(@class), ' '), ' toctree-wrapper ')]/ul"
+    "/li[contains(concat(' ', normalize-space(@class), ' '), "
+    "' toctree-l1 ')]/a"
+)
+DOWNLOAD_LINKS = {
+    archive_format: Selector(
+        f'div[role="main"] table.docutils a[href$="{suffix}"]',
+        "//div[@role='main']//table[contains(concat(' ', "
+        "normalize-space(@class), ' '), ' docutils ')]"
+        f"//a[substring(@href, string-length(@href) - {len(suffix) - 1})"
+        f" = '{suffix}']"
     )
+    for archive_format, suffix in DOWNLOAD_FORMATS.items()
+}
+PEP_INDEX_ROWS = Selector("tbody tr", ".//tbody//tr")
 
-    logs = []
 
-    for link in sections:
-        version_link = urljoin(whats_new_url, link['href'])
+def extract_whats_new_page(response, backend=DEFAULT_BACKEND):
+    page = backend.parse(response.text, WHATS_NEW_PAGE_SPEC)
+    dl_text = backend.text(backend.find(page, 'dl')).replace('\n', ' ')
+    return backend.text(backend.find(page, 'h1')), dl_text
+
+
+def extract_whats_new_links(response, backend=DEFAULT_BACKEND):
+    page = backend.parse(response.text, WHATS_NEW_INDEX_SPEC)
+    return [
+        urljoin(response.url, link.get('href'))
+        for link in backend.select(page, WHATS_NEW_LINKS)
+    ]
+
+
+def parse_whats_new_page(session, parse_cache, parse_pool, backend,
+                         version_link):
+    title, editor = get_parsed(
+        session,
+        version_link,
+        partial(extract_whats_new_page, backend=backend),
+        parse_cache,
+        parse_pool
+    )
+    return WhatsNewRow(version_link, title, editor)
+
+
+def whats_new(session, workers=DEFAULT_WORKERS, parse_cache=None,
+              parse_pool=None, backend=DEFAULT_BACKEND, **kwargs):
+    version_links = extract_whats_new_links(
+        get_response(session, urljoin(MAIN_DOC_URL, "whatsnew/")), backend
+    )
+    yield WHATS_NEW_HEADER
+    yield from whats_new_rows(
+        version_links,
+        map_ordered(
+            partial(
+                parse_whats_new_page, session, parse_cache, parse_pool,
+                backend
+            ),
+            version_links,
+            workers
+        )
+    )
+
+
+def whats_new_rows(version_links, futures):
+    logs = []
+    for version_link, future in zip(version_links, futures):
         try:
-            soup_version = get_soup(session, version_link)
-            dl = find_tag(soup_version, 'dl')
-            dl_text = dl.text.replace('\n', ' ')
-            results.append(
-                (version_link, find_tag(soup_version, 'h1').text, dl_text)
-            )
+            row = future.result()
         except (ParserFindTagException, ConnectionError) as exc:
             logs.append(WHATS_NEW_ERROR.format(url=version_link, exc=exc))
+            continue
+        yield row
 
     list(map(logging.warning, logs))
 
-    return results
+
+async def async_parse_whats_new_page(client, parse_cache, parse_pool,
+                                     backend, version_link):
+    title, editor = await client.get_parsed(
+        version_link,
+        partial(extract_whats_new_page, backend=backend),
+        parse_cache,
+        parse_pool
+    )
+    return WhatsNewRow(version_link, title, editor)
+
+
+async def async_whats_new(client, parse_cache=None, parse_pool=None,
+                          backend=DEFAULT_BACKEND, **kwargs):
+    version_links = await client.get_parsed(
+        urljoin(MAIN_DOC_URL, "whatsnew/"),
+        partial(extract_whats_new_links, backend=backend)
+    )
+    futures = await client.map_ordered(
+        partial(
+            async_parse_whats_new_page, client, parse_cache, parse_pool,
+            backend
+        ),
+        version_links
+    )
+    return [WHATS_NEW_HEADER, *whats_new_rows(version_links, futures)]
+
+
+def latest_versions(session, parse_cache=None, parse_pool=None,
+                    backend=DEFAULT_BACKEND, **kwargs):
+    yield ("Ссылка на документацию", "Версия", "Статус")
+    yield from get_parsed(
+        session,
+        MAIN_DOC_URL,
+        partial(extract_versions, backend=backend),
+        parse_cache,
+        parse_pool
+    )
 
 
-def latest_versions(session):
-    soup = get_soup(session, MAIN_DOC_URL)
-    sidebar = find_tag(soup, "div", attrs={"class": "sphinxsidebarwrapper"})
+def extract_versions(response, backend=DEFAULT_BACKEND):
+    page = backend.parse(response.text, LATEST_VERSIONS_SPEC)
+    sidebar = backend.find(
+        page, "div", attrs={"class": "sphinxsidebarwrapper"}
+    )
     versions_ul = None
 
-    for ul in sidebar.find_all("ul"):
-        if "All versions" in ul.text:
+    for ul in backend.find_all(sidebar, "ul"):
+        if "All versions" in backend.text(ul):
             versions_ul = ul
             break
 
     if versions_ul is None:
         raise RuntimeError(VERSION_NOT_FOUND)
 
-    results = [("Ссылка на документацию", "Версия", "Статус")]
-    for a_tag in versions_ul.find_all("a"):
-        link = a_tag["href"]
-        if match := re.search(VERSION_PATTERN, a_tag.text):
+    results = []
+    for a_tag in backend.find_all(versions_ul, "a"):
+        link = a_tag.get("href")
+        text = backend.text(a_tag)
+        if match := re.search(VERSION_PATTERN, text):
             version, status = match.groups()
         else:
-            version, status = a_tag.text, ""
-        results.append((link, version, status))
+            version, status = text, ""
+        results.append(VersionRow(link, version, status))
 
     return results
 
 
-def download(session):
+def save_archive(session, downloads_dir, bandwidth, archive_url):
+    archive_path = downloads_dir / archive_url.split("/")[-1]
+    if is_up_to_date(session, archive_url, archive_path):
+        logging.info(DOWNLOAD_SKIPPED.format(archive_path=archive_path))
+        return
+    checksum = download_archive(
+        session, archive_url, archive_path, bandwidth=bandwidth
+    )
+    logging.info(DOWNLOAD_SAVED.format(
+        archive_path=archive_path, checksum=checksum
+    ))
+
+
+def download(session, workers=DEFAULT_WORKERS,
+             formats=DEFAULT_DOWNLOAD_FORMATS, bandwidth_limit=None,
+             backend=DEFAULT_BACKEND, **kwargs):
     downloads_dir = BASE_DIR / DOWNLOADS_DIR
     downloads_dir.mkdir(exist_ok=True)
     downloads_url = urljoin(MAIN_DOC_URL, "download.html")
-    soup = get_soup(session, downloads_url)
+    page = backend.parse(
+        get_response(session, downloads_url).text, DOWNLOAD_SPEC
+    )
 
-    pdf_a4_link = soup.select_one(
-        'div[role="main"] table.docutils a[href$="pdf-a4.zip"]'
-    )["href"]
-    archive_url = urljoin(downloads_url, pdf_a4_link)
-    filename = archive_url.split("/")[-1]
-    archive_path = downloads_dir / filename
+    archive_urls = []
+    logs = []
+    for archive_format in formats:
+        archive_link = backend.select_one(
+            page, DOWNLOAD_LINKS[archive_format]
+        )
+        if archive_link is None:
+            logs.append(ARCHIVE_NOT_FOUND.format(format=archive_format))
+            continue
+        archive_urls.append(
+            urljoin(downloads_url, archive_link.get("href"))
+        )
+
+    bandwidth = None
+    if bandwidth_limit:
+        from transport import TokenBucket
+        bandwidth = TokenBucket(bandwidth_limit * 1024)
+    futures = map_ordered(
+        partial(save_archive, session, downloads_dir, bandwidth),
+        archive_urls,
+        workers
+    )
+    for archive_url, future in zip(archive_urls, futures):
+        try:
+            future.result()
+        except (ConnectionError, DownloadError) as exc:
+            logs.append(DOWNLOAD_ERROR.format(url=archive_url, exc=exc))
 
-    response = session.get(archive_url)
-    with open(archive_path, "wb") as f:
-        f.write(response.content)
+    list(map(logging.warning, logs))
 
-    logging.info(DOWNLOAD_SAVED.format(archive_path=archive_path))
+
+def extract_pep_category(backend, category_section):
+    headings = backend.find_all(category_section, "h3")[:1]
+    return "".join(
+        backend.text(heading).rstrip("¶").strip() for heading in headings
+    )
 
 
-def pep(session):
-    soup = get_soup(session, PEP_URL)
-    section = find_tag(soup, "section", attrs={"id": "index-by-category"})
-    if not (tables := section.find_all("table")):
+def extract_pep_record(backend, category, pep_row):
+    preview = backend.text(backend.find(pep_row, "abbr")).strip()
+    pep_card_tag = backend.find(pep_row, "a")
+    pep_card_url = urljoin(
+        PEP_URL, pep_card_tag.get("href").rstrip("/") + "/"
+    )
+    try:
+        number = int(backend.text(pep_card_tag))
+    except ValueError as exc:
+        logging.warning(PEP_ROW_ERROR.format(
+            pep_card_url=pep_card_url, exc=exc
+        ))
+        return None
+    return PepRecord(
+        url=pep_card_url,
+        expected_status=EXPECTED_STATUS.get(preview[1:], ()),
+        number=number,
+        type=preview[:1],
+        index_status=preview[1:],
+        category=category,
+    )
+
+
+def extract_pep_index(response, backend=DEFAULT_BACKEND):
+    page = backend.parse(response.text, PEP_INDEX_SPEC)
+    section = backend.find(page, "section", attrs={"id": "index-by-category"})
+    if not backend.find_all(section, "table"):
         raise RuntimeError(PEP_NO_TABLES)
 
-    temp_results = defaultdict(int)
-    logs = []
+    pep_rows = []
+    for category_section in backend.find_all(section, "section") or [
+        section
+    ]:
+        category = extract_pep_category(backend, category_section)
+        pep_rows.extend(filter(None, (
+            extract_pep_record(backend, category, pep_row)
+            for pep_row in backend.select(category_section, PEP_INDEX_ROWS)
+        )))
+    return pep_rows
 
-    for table in tables:
-        for pep_row in table.select("tbody tr"):
-            preview_status = find_tag(pep_row, "abbr").text.strip()[1:]
-            expected_status = EXPECTED_STATUS.get(preview_status, [])
 
-            pep_card_tag = find_tag(pep_row, "a")
-            pep_card_url = urljoin(
-                PEP_URL, pep_card_tag["href"].rstrip("/") + "/"
-            )
+def extract_pep_card_status(response):
+    return find_tag_in_stream(response, response.url, "abbr").strip()
 
-            try:
-                pep_soup = get_soup(session, pep_card_url)
-                pep_card_status = find_tag(pep_soup, "abbr").text.strip()
 
-                if pep_card_status not in expected_status:
-                    logs.append(ERROR_MESSAGE.format(
-                        pep_card_link=pep_card_url,
-                        pep_card_status=pep_card_status,
-                        expected_status=expected_status
-                    ))
-                temp_results[pep_card_status] += 1
+def get_pep_card_status(session, parse_cache, pep_card_url):
+    return get_parsed(
+        session, pep_card_url, extract_pep_card_status, parse_cache,
+        stream=True
+    )
 
-            except (ParserFindTagException, ConnectionError) as exc:
-                logs.append(PEP_PROCESS_ERROR.format(
-                    pep_card_url=pep_card_url,
-                    exc=exc,
-                ))
 
+def check_pep_card_status(session, state, pep_card_url):
+    response = get_response(
+        session,
+        pep_card_url,
+        headers={**NO_STORE, **state.conditional_headers(pep_card_url)},
+        stream=True,
+    )
+    if (
+        response.status_code == HTTPStatus.NOT_MODIFIED
+        and pep_card_url in state.cards
+    ):
+        response.close()
+        return state.unchanged_status(pep_card_url)
+    pep_card_status = extract_pep_card_status(response)
+    state.update(pep_card_url, pep_card_status, response.headers)
+    return pep_card_status
+
+
+async def async_get_pep_card_status(client, parse_cache, pep_card_url):
+    return await client.get_parsed(
+        pep_card_url, extract_pep_card_status, parse_cache
+    )
+
+
+async def async_check_pep_card_status(client, state, pep_card_url):
+    response = await client.get(
+        pep_card_url, headers=state.conditional_headers(pep_card_url)
+    )
+    if (
+        response.status_code == HTTPStatus.NOT_MODIFIED
+        and pep_card_url in state.cards
+    ):
+        return state.unchanged_status(pep_card_url)
+    pep_card_status = await client.parse(response, extract_pep_card_status)
+    state.update(pep_card_url, pep_card_status, response.headers)
+    return pep_card_status
+
+
+def open_pep_index(enabled=True):
+    if not enabled:
+        return nullcontext()
+    return PepIndex(BASE_DIR / PEP_INDEX_FILE, EXPECTED_STATUS)
+
+
+def collect_pep_incremental(session, workers, parse_cache, parse_pool,
+                            backend, pep_index):
+    state = PepState(BASE_DIR / PEP_STATE_FILE)
+    table = collect_pep_statuses(
+        session,
+        partial(check_pep_card_status, session, state),
+        workers,
+        parse_cache,
+        parse_pool,
+        backend,
+        pep_index,
+        headers=NO_STORE
+    )
+    state.save()
+    logging.info(PEP_UNCHANGED.format(count=state.unchanged))
+    return table
+
+
+async def async_collect_pep_incremental(client, parse_cache, parse_pool,
+                                        backend, pep_index):
+    state = PepState(BASE_DIR / PEP_STATE_FILE)
+    with client.cache_disabled():
+        table = await async_collect_pep_statuses(
+            client,
+            partial(async_check_pep_card_status, client, state),
+            parse_cache,
+            parse_pool,
+            backend,
+            pep_index
+        )
+    state.save()
+    logging.info(PEP_UNCHANGED.format(count=state.unchanged))
+    return table
+
+
+def pep(session, workers=DEFAULT_WORKERS, incremental=False,
+        parse_cache=None, parse_pool=None, backend=DEFAULT_BACKEND,
+        pep_index=False, query=None, report=DEFAULT_PEP_REPORT, **kwargs):
+    if query is not None:
+        with open_pep_index() as index:
+            yield from QUERY_TO_FUNCTION[query](index)
+        return
+    with open_pep_index(pep_index) as index:
+        if incremental:
+            table = collect_pep_incremental(
+                session, workers, parse_cache, parse_pool, backend, index
+            )
+        else:
+            table = collect_pep_statuses(
+                session,
+                partial(get_pep_card_status, session, parse_cache),
+                workers,
+                parse_cache,
+                parse_pool,
+                backend,
+                index
+            )
+    yield from REPORT_TO_FUNCTION[report](table)
+
+
+def collect_pep_statuses(session, get_status, workers, parse_cache=None,
+                         parse_pool=None, backend=DEFAULT_BACKEND,
+                         pep_index=None, **kwargs):
+    pep_rows = get_parsed(
+        session,
+        PEP_URL,
+        partial(extract_pep_index, backend=backend),
+        parse_cache,
+        parse_pool,
+        **kwargs
+    )
+    futures = map_ordered(
+        get_status, [pep_row.url for pep_row in pep_rows], workers
+    )
+    return fill_pep_table(pep_rows, futures, pep_index)
+
+
+async def async_pep(client, incremental=False, parse_cache=None,
+                    parse_pool=None, backend=DEFAULT_BACKEND,
+                    pep_index=False, query=None,
+                    report=DEFAULT_PEP_REPORT, **kwargs):
+    if query is not None:
+        with open_pep_index() as index:
+            return list(QUERY_TO_FUNCTION[query](index))
+    with open_pep_index(pep_index) as index:
+        if incremental:
+            table = await async_collect_pep_incremental(
+                client, parse_cache, parse_pool, backend, index
+            )
+        else:
+            table = await async_collect_pep_statuses(
+                client,
+                partial(async_get_pep_card_status, client, parse_cache),
+                parse_cache,
+                parse_pool,
+                backend,
+                index
+            )
+    return list(REPORT_TO_FUNCTION[report](table))
+
+
+async def async_collect_pep_statuses(client, get_status, parse_cache=None,
+                                     parse_pool=None,
+                                     backend=DEFAULT_BACKEND,
+                                     pep_index=None):
+    pep_rows = await client.get_parsed(
+        PEP_URL,
+        partial(extract_pep_index, backend=backend),
+        parse_cache,
+        parse_pool
+    )
+    futures = await client.map_ordered(
+        get_status, [pep_row.url for pep_row in pep_rows]
+    )
+    return fill_pep_table(pep_rows, futures, pep_index)
+
+
+def fill_pep_table(pep_rows, futures, pep_index=None):
+    table = PepTable()
+    logs = []
+    for pep_row, future in zip(pep_rows, futures):
+        try:
+            pep_card_status = future.result()
+        except (ParserFindTagException, ConnectionError) as exc:
+            logs.append(PEP_PROCESS_ERROR.format(
+                pep_card_url=pep_row.url,
+                exc=exc,
+            ))
+            pep_card_status = None
+        table.append(pep_row, pep_card_status)
+
+    logs.extend(
+        ERROR_MESSAGE.format(
+            pep_card_link=pep_card_url,
+            pep_card_status=pep_card_status,
+            expected_status=expected_status
+        )
+        for pep_card_url, pep_card_status, expected_status
+        in table.mismatched()
+    )
     list(map(logging.warning, logs))
+    if pep_index is not None:
+        logging.info(PEP_INDEX_UPDATED.format(
+            count=pep_index.update(table.records())
+        ))
+    return table
 
-    return [
-        ("Статус", "Количество"),
-        *temp_results.items(),
-        ("Всего", sum(temp_results.values()))
-    ]
 
+REPORT_TO_FUNCTION = {
+    "statuses": PepTable.statuses,
+    "confusion": PepTable.confusion,
+    "categories": PepTable.categories,
+}
+
+QUERY_TO_FUNCTION = {
+    "mismatched": PepIndex.mismatched,
+    "counts": PepIndex.counts,
+}
 
 MODE_TO_FUNCTION = {
     "whats-new": whats_new,
@@ -157,21 +533,161 @@ MODE_TO_FUNCTION = {
 }
 
 
+ROWLESS_MODES = {"download"}
+
+ASYNC_MODE_TO_FUNCTION = {
+    "whats-new": async_whats_new,
+    "pep": async_pep,
+}
+
+
+def run_async_mode(session, args, mode_function, **kwargs):
+    import asyncio
+
+    from async_http import AsyncClient
+
+    async def run_client():
+        async with AsyncClient(
+            session,
+            args.concurrency,
+            args.workers,
+            args.timeout,
+            args.retries,
+            args.rate_limit
+        ) as client:
+            return await mode_function(client, **kwargs)
+
+    return asyncio.run(run_client())
+
+
+def run_mode(session, args, parse_cache, mode, parse_pool=None):
+    if args.engine == ENGINE_ASYNC and mode in ASYNC_MODE_TO_FUNCTION:
+        return run_async_mode(
+            session, args, ASYNC_MODE_TO_FUNCTION[mode],
+            **mode_kwargs(args, parse_cache, parse_pool)
+        )
+    return MODE_TO_FUNCTION[mode](
+        session, **mode_kwargs(args, parse_cache, parse_pool)
+    )
+
+
+def mode_kwargs(args, parse_cache, parse_pool=None):
+    return dict(
+        workers=args.workers,
+        incremental=args.incremental,
+        parse_cache=parse_cache,
+        parse_pool=parse_pool,
+        formats=args.formats,
+        bandwidth_limit=args.bandwidth_limit,
+        backend=BACKENDS[args.backend],
+        pep_index=args.pep_index,
+        query=args.query,
+        report=args.report
+    )
+
+
+def collect_mode(session, args, parse_cache, mode, parse_pool=None):
+    results = run_mode(session, args, parse_cache, mode, parse_pool)
+    return None if results is None else list(results)
+
+
+def mode_args(args, mode):
+    return Namespace(**{**vars(args), "mode": mode})
+
+
+def selected_modes(args):
+    if MODE_ALL in args.mode:
+        return list(MODE_TO_FUNCTION)
+    return list(dict.fromkeys(args.mode))
+
+
+def refresh_mode(session, args, parse_cache, mode, parse_pool=None):
+    results = collect_mode(session, args, parse_cache, mode, parse_pool)
+    if parse_cache is not None:
+        parse_cache.save()
+    return results
+
+
+def run_modes(session, args, parse_cache, parse_pool=None):
+    modes = selected_modes(args)
+
+    if len(modes) == 1:
+        results = run_mode(session, args, parse_cache, modes[0], parse_pool)
+        if results is not None:
+            control_output(results, mode_args(args, modes[0]))
+        return
+
+    futures = map_ordered(
+        partial(collect_mode, session, args, parse_cache,
+                parse_pool=parse_pool),
+        modes,
+        len(modes)
+    )
+    for mode, future in zip(modes, futures):
+        try:
+            if (results := future.result()) is not None:
+                control_output(results, mode_args(args, mode))
+        except Exception as e:
+            logging.exception(MODE_ERROR.format(mode=mode, error=e))
+
+
+def make_parse_pool(args):
+    if not args.processes:
+        return nullcontext()
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=args.processes)
+
+
+def run(session, args, parse_cache, parse_pool=None):
+    if args.serve:
+        from server import serve
+        serve(
+            partial(refresh_mode, session, args, parse_cache,
+                    parse_pool=parse_pool),
+            [
+                mode for mode in selected_modes(args)
+                if mode not in ROWLESS_MODES
+            ],
+            args.host,
+            args.port,
+            args.refresh_interval
+        )
+    elif args.profile:
+        from profiling import profile_call
+        profile_output(
+            profile_call(run_modes, session, args, parse_cache, parse_pool),
+            args
+        )
+    else:
+        run_modes(session, args, parse_cache, parse_pool)
+
+
 def main():
+    parser = configure_argument_parser([*MODE_TO_FUNCTION, MODE_ALL])
+    args = validate_args(parser, parser.parse_args())
     configure_logging()
     logging.info(PARSER_START)
     try:
-        parser = configure_argument_parser(MODE_TO_FUNCTION.keys())
-        args = parser.parse_args()
         logging.info(ARGS.format(args=args))
+        METRICS.enabled = args.metrics is not None
 
-        session = requests_cache.CachedSession()
+        session = configure_session(args)
+        parse_cache = None
+        if args.parse_cache_size:
+            parse_cache = ParseCache(
+                BASE_DIR / PARSE_CACHE_FILE, args.parse_cache_size
+            )
         if args.clear_cache:
             session.cache.clear()
-
-        results = MODE_TO_FUNCTION[args.mode](session)
-        if results:
-            control_output(results, args)
+            if parse_cache is not None:
+                parse_cache.clear()
+
+        with make_parse_pool(args) as parse_pool:
+            run(session, args, parse_cache, parse_pool)
+        if parse_cache is not None:
+            parse_cache.save()
+        if METRICS.enabled:
+            metrics_output(METRICS, args.metrics)
 
     except Exception as e:
         logging.exception(ERROR.format(error=e))
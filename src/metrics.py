@@ -0,0 +1,117 @@
+import json
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock, local
+from time import perf_counter
+
+STAGE_HEADER = ("Этап", "Вызовов", "Всего, с", "Собственное, с")
+COUNTER_HEADER = ("Счётчик", "Значение")
+
+
+class Metrics:
+    """Время этапов работы парсера и счётчики событий.
+
+    Для каждого этапа учитывается полное время и собственное время
+    без вложенных этапов того же потока. Пока сбор выключен, обёртки
+    не делают замеров.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.stages = defaultdict(lambda: [0, 0.0, 0.0])
+        self.counters = defaultdict(int)
+        self._lock = Lock()
+        self._local = local()
+
+    def reset(self):
+        with self._lock:
+            self.stages.clear()
+            self.counters.clear()
+
+    @contextmanager
+    def timed(self, stage):
+        if not self.enabled:
+            yield
+            return
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append(0.0)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self._lock:
+                calls = self.stages[stage]
+                calls[0] += 1
+                calls[1] += elapsed
+                calls[2] += elapsed - children
+
+    def timed_function(self, stage):
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timed(stage):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def timed_iter(self, stage, iterable):
+        iterator = iter(iterable)
+        while True:
+            with self.timed(stage):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def count(self, counter, value=1):
+        if self.enabled:
+            with self._lock:
+                self.counters[counter] += value
+
+    def stage_rows(self):
+        with self._lock:
+            return [
+                (stage, calls, round(total, 6), round(own, 6))
+                for stage, (calls, total, own) in sorted(self.stages.items())
+            ]
+
+    def counter_rows(self):
+        with self._lock:
+            return sorted(self.counters.items())
+
+    def to_json(self):
+        return json.dumps({
+            "stages": {
+                stage: {"calls": calls, "seconds": total, "self_seconds": own}
+                for stage, calls, total, own in self.stage_rows()
+            },
+            "counters": dict(self.counter_rows()),
+        }, ensure_ascii=False, indent=2)
+
+    def to_prometheus(self):
+        lines = [
+            "# TYPE parser_stage_calls_total counter",
+            "# TYPE parser_stage_seconds_total counter",
+            "# TYPE parser_stage_self_seconds_total counter",
+        ]
+        for stage, calls, total, own in self.stage_rows():
+            lines.extend([
+                f'parser_stage_calls_total{{stage="{stage}"}} {calls}',
+                f'parser_stage_seconds_total{{stage="{stage}"}} {total}',
+                f'parser_stage_self_seconds_total{{stage="{stage}"}} {own}',
+            ])
+        lines.append("# TYPE parser_events_total counter")
+        lines.extend(
+            f'parser_events_total{{event="{counter}"}} {value}'
+            for counter, value in self.counter_rows()
+        )
+        return "\n".join(lines) + "\n"
+
+
+METRICS = Metrics()
@@ -1,13 +1,21 @@
 import csv
+import gzip
+import json
 import logging
 from datetime import datetime
+from itertools import islice
 
-from prettytable import PrettyTable
-
-from constants import (BASE_DIR, DATETIME_FORMAT, OUTPUT_FILE, OUTPUT_PRETTY,
-                       RESULTS_DIR)
+from constants import (BASE_DIR, DATETIME_FORMAT, METRICS_DIR, METRICS_JSON,
+                       METRICS_TABLE, OUTPUT_ARROW, OUTPUT_BATCH_SIZE,
+                       OUTPUT_FILE, OUTPUT_JSONL, OUTPUT_PARQUET,
+                       OUTPUT_PRETTY, PROFILES_DIR, RESULTS_DIR)
+from metrics import COUNTER_HEADER, METRICS, STAGE_HEADER
 
 OUTPUT_SAVED = "Файл с результатами был сохранён: {file_path}"
+METRICS_SAVED = "Файл с метриками был сохранён: {file_path}"
+PROFILE_SAVED = "Файл профиля был сохранён: {file_path}"
+PYARROW_REQUIRED = "Для вывода в формате {output} установите пакет pyarrow"
+JSONL_COMPRESSION = "Для JSON Lines поддерживается только сжатие gzip"
 
 
 def default_output(results, **kwargs):
@@ -16,21 +24,34 @@ def default_output(results, **kwargs):
 
 
 def pretty_output(results, **kwargs):
+    from prettytable import PrettyTable
+    rows = iter(results)
     table = PrettyTable()
-    table.field_names = results[0]
+    table.field_names = next(rows)
     table.align = "l"
-    table.add_rows(results[1:])
+    for row in rows:
+        table.add_row(row)
     print(table)
 
 
-def file_output(results, cli_args, **kwargs):
+def get_file_path(cli_args, extension):
     results_dir = BASE_DIR / RESULTS_DIR
     results_dir.mkdir(exist_ok=True)
-    file_path = results_dir / "{}_{}.csv".format(
+    return results_dir / "{}_{}.{}".format(
         cli_args.mode,
-        datetime.now().strftime(DATETIME_FORMAT)
+        datetime.now().strftime(DATETIME_FORMAT),
+        extension
     )
-    with open(file_path, "w", encoding="utf-8") as f:
+
+
+def batched(rows, size):
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def file_output(results, cli_args, **kwargs):
+    file_path = get_file_path(cli_args, "csv")
+    with open(file_path, "w", encoding="utf-8", buffering=1) as f:
         csv.writer(
             f,
             dialect=csv.unix_dialect
@@ -40,12 +61,141 @@ def file_output(results, cli_args, **kwargs):
     logging.info(OUTPUT_SAVED.format(file_path=file_path))
 
 
+def jsonl_output(results, cli_args, **kwargs):
+    compression = getattr(cli_args, "compression", None)
+    if compression not in (None, "gzip"):
+        raise ValueError(JSONL_COMPRESSION)
+    rows = iter(results)
+    header = next(rows)
+    if compression:
+        file_path = get_file_path(cli_args, "jsonl.gz")
+        f = gzip.open(file_path, "wt", encoding="utf-8")
+    else:
+        file_path = get_file_path(cli_args, "jsonl")
+        f = open(file_path, "w", encoding="utf-8")
+    with f:
+        for batch in batched(rows, OUTPUT_BATCH_SIZE):
+            f.writelines(
+                json.dumps(dict(zip(header, row)), ensure_ascii=False) + "\n"
+                for row in batch
+            )
+    logging.info(OUTPUT_SAVED.format(file_path=file_path))
+
+
+def import_pyarrow(output):
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise RuntimeError(PYARROW_REQUIRED.format(output=output)) from exc
+    return pyarrow
+
+
+def record_batches(pa, results):
+    rows = iter(results)
+    header = next(rows)
+    schema = None
+    for batch in batched(rows, OUTPUT_BATCH_SIZE):
+        columns = list(zip(*batch))
+        if schema is None:
+            record_batch = pa.record_batch(
+                [pa.array(column) for column in columns], names=header
+            )
+            schema = record_batch.schema
+        else:
+            record_batch = pa.record_batch(
+                [
+                    pa.array(column, type=field.type)
+                    for column, field in zip(columns, schema)
+                ],
+                schema=schema
+            )
+        yield record_batch
+    if schema is None:
+        yield pa.record_batch(
+            [pa.array([], type=pa.string()) for _ in header], names=header
+        )
+
+
+def arrow_output(results, cli_args, **kwargs):
+    pa = import_pyarrow(OUTPUT_ARROW)
+    file_path = get_file_path(cli_args, "arrow")
+    options = pa.ipc.IpcWriteOptions(
+        compression=getattr(cli_args, "compression", None)
+    )
+    writer = None
+    for record_batch in record_batches(pa, results):
+        if writer is None:
+            writer = pa.ipc.new_file(
+                str(file_path), record_batch.schema, options=options
+            )
+        writer.write_batch(record_batch)
+    if writer is not None:
+        writer.close()
+    logging.info(OUTPUT_SAVED.format(file_path=file_path))
+
+
+def parquet_output(results, cli_args, **kwargs):
+    pa = import_pyarrow(OUTPUT_PARQUET)
+    import pyarrow.parquet as pq
+
+    file_path = get_file_path(cli_args, "parquet")
+    writer = None
+    for record_batch in record_batches(pa, results):
+        if writer is None:
+            writer = pq.ParquetWriter(
+                str(file_path),
+                record_batch.schema,
+                compression=getattr(cli_args, "compression", None) or "none"
+            )
+        writer.write_batch(record_batch)
+    if writer is not None:
+        writer.close()
+    logging.info(OUTPUT_SAVED.format(file_path=file_path))
+
+
 OUTPUT_HANDLERS = {
     OUTPUT_PRETTY: pretty_output,
     OUTPUT_FILE: file_output,
+    OUTPUT_JSONL: jsonl_output,
+    OUTPUT_ARROW: arrow_output,
+    OUTPUT_PARQUET: parquet_output,
     None: default_output,
 }
 
 
 def control_output(results, cli_args):
-    OUTPUT_HANDLERS.get(cli_args.output)(results, cli_args=cli_args)
+    rows = METRICS.timed_iter("rows", results)
+    with METRICS.timed("control_output"):
+        OUTPUT_HANDLERS.get(cli_args.output)(rows, cli_args=cli_args)
+
+
+def metrics_output(metrics, metrics_format):
+    if metrics_format == METRICS_TABLE:
+        for header, rows in ((STAGE_HEADER, metrics.stage_rows()),
+                             (COUNTER_HEADER, metrics.counter_rows())):
+            pretty_output([header, *rows])
+        return
+    metrics_dir = BASE_DIR / METRICS_DIR
+    metrics_dir.mkdir(exist_ok=True)
+    extension, text = (
+        ("json", metrics.to_json()) if metrics_format == METRICS_JSON
+        else ("prom", metrics.to_prometheus())
+    )
+    file_path = metrics_dir / "metrics_{}.{}".format(
+        datetime.now().strftime(DATETIME_FORMAT), extension
+    )
+    file_path.write_text(text, encoding="utf-8")
+    logging.info(METRICS_SAVED.format(file_path=file_path))
+
+
+def profile_output(stats, cli_args):
+    from profiling import SUMMARY_HEADER, TOP_HEADER, subsystem_rows, top_rows
+    profiles_dir = BASE_DIR / PROFILES_DIR
+    profiles_dir.mkdir(exist_ok=True)
+    file_path = profiles_dir / "{}_{}.prof".format(
+        "-".join(cli_args.mode), datetime.now().strftime(DATETIME_FORMAT)
+    )
+    stats.dump_stats(file_path)
+    logging.info(PROFILE_SAVED.format(file_path=file_path))
+    pretty_output([SUMMARY_HEADER, *subsystem_rows(stats)])
+    pretty_output([TOP_HEADER, *top_rows(stats, cli_args.profile_top)])
@@ -0,0 +1,78 @@
+import hashlib
+import pickle
+from collections import OrderedDict
+from threading import Lock
+
+from constants import PARSE_CACHE_VERSION
+from metrics import METRICS
+from parse_pool import run_parse
+
+
+class ParseCache:
+    """LRU-кеш извлечённых со страниц данных.
+
+    Запись привязана к URL, функции разбора и отпечатку ответа, поэтому
+    при изменении страницы она перестаёт совпадать и разбирается заново.
+    Файл кеша другой версии формата при загрузке отбрасывается.
+    Потоковые ответы без ETag и Last-Modified разбираются мимо кеша:
+    хеш тела потребовал бы прочитать его целиком.
+    """
+
+    def __init__(self, path, max_entries):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self.entries = OrderedDict()
+        try:
+            with open(path, "rb") as f:
+                version, entries = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError,
+                TypeError, ValueError, AttributeError, ImportError):
+            return
+        if version == PARSE_CACHE_VERSION:
+            self.entries = entries
+
+    @staticmethod
+    def fingerprint(response):
+        for header in ("ETag", "Last-Modified"):
+            if value := response.headers.get(header):
+                return f"{header}: {value}"
+        if response._content is False:
+            return None
+        return hashlib.sha1(response.content).hexdigest()
+
+    def get_or_parse(self, response, parse, parse_pool=None):
+        key = (getattr(parse, "func", parse).__name__, response.url)
+        fingerprint = self.fingerprint(response)
+        if fingerprint is None:
+            return run_parse(parse, response, parse_pool)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                METRICS.count("parse_cache_hits")
+                return entry[1]
+            self.misses += 1
+        METRICS.count("parse_cache_misses")
+        value = run_parse(parse, response, parse_pool)
+        with self._lock:
+            self.entries[key] = (fingerprint, value)
+            self.entries.move_to_end(key)
+            while self.entries and len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+
+    def save(self):
+        with self._lock:
+            entries = OrderedDict(self.entries)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump((PARSE_CACHE_VERSION, entries), f)
+        tmp_path.replace(self.path)
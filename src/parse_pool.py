@@ -0,0 +1,21 @@
+from metrics import METRICS
+
+
+def parse_body(parse, url, content, encoding):
+    from requests import Response
+    response = Response()
+    response.url = url
+    response.status_code = 200
+    response.encoding = encoding
+    response._content = content
+    response._content_consumed = True
+    return parse(response)
+
+
+def run_parse(parse, response, parse_pool=None):
+    if parse_pool is None:
+        return parse(response)
+    METRICS.count("bytes_parsed", len(response.content))
+    return parse_pool.submit(
+        parse_body, parse, response.url, response.content, response.encoding
+    ).result()
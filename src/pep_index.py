@@ -0,0 +1,113 @@
+import sqlite3
+
+from records import PepIndexRow, StatusTypeRow
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS peps (
+    number INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    type TEXT NOT NULL,
+    index_status TEXT NOT NULL,
+    card_status TEXT,
+    category TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS peps_card_status ON peps (card_status);
+CREATE INDEX IF NOT EXISTS peps_index_status ON peps (index_status);
+CREATE INDEX IF NOT EXISTS peps_type ON peps (type, card_status);
+CREATE TEMP TABLE expected_statuses (
+    index_status TEXT NOT NULL,
+    card_status TEXT NOT NULL
+);
+"""
+UPSERT = """
+INSERT INTO peps (number, url, type, index_status, card_status, category)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (number) DO UPDATE SET
+    url = excluded.url,
+    type = excluded.type,
+    index_status = excluded.index_status,
+    card_status = coalesce(excluded.card_status, peps.card_status),
+    category = excluded.category
+WHERE peps.url IS NOT excluded.url
+    OR peps.type IS NOT excluded.type
+    OR peps.index_status IS NOT excluded.index_status
+    OR peps.card_status IS NOT coalesce(excluded.card_status, peps.card_status)
+    OR peps.category IS NOT excluded.category
+"""
+MISMATCHED = """
+SELECT number, url, type, index_status, card_status, category
+FROM peps
+WHERE card_status IS NOT NULL AND NOT EXISTS (
+    SELECT 1 FROM expected_statuses AS expected
+    WHERE expected.index_status = peps.index_status
+        AND expected.card_status = peps.card_status
+)
+ORDER BY number
+"""
+COUNTS = """
+SELECT card_status, type, count(*)
+FROM peps
+WHERE card_status IS NOT NULL
+GROUP BY card_status, type
+ORDER BY card_status, type
+"""
+
+MISMATCHED_HEADER = (
+    "Номер", "Ссылка", "Тип", "Статус в индексе", "Статус в карточке",
+    "Категория"
+)
+COUNTS_HEADER = ("Статус", "Тип", "Количество")
+
+
+class PepIndex:
+    """Локальный индекс PEP в SQLite.
+
+    Хранит номер, ссылку, тип, статусы из общего индекса и карточки
+    и категорию каждого PEP и отвечает на запросы без обращения к сети.
+    """
+
+    def __init__(self, path, expected_statuses):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self.connection.executemany(
+            "INSERT INTO expected_statuses VALUES (?, ?)",
+            [
+                (index_status, card_status)
+                for index_status, card_statuses in expected_statuses.items()
+                for card_status in card_statuses
+            ]
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.connection.close()
+
+    def update(self, records):
+        with self.connection:
+            changes = self.connection.total_changes
+            self.connection.executemany(UPSERT, records)
+            numbers = {record[0] for record in records}
+            self.connection.executemany(
+                "DELETE FROM peps WHERE number = ?",
+                [
+                    (number,) for number, in self.connection.execute(
+                        "SELECT number FROM peps"
+                    )
+                    if number not in numbers
+                ]
+            )
+            return self.connection.total_changes - changes
+
+    def mismatched(self):
+        return [
+            MISMATCHED_HEADER,
+            *map(PepIndexRow._make, self.connection.execute(MISMATCHED))
+        ]
+
+    def counts(self):
+        return [
+            COUNTS_HEADER,
+            *map(StatusTypeRow._make, self.connection.execute(COUNTS))
+        ]
@@ -0,0 +1,46 @@
+import json
+from threading import Lock
+
+
+class PepState:
+    """Последние известные статусы карточек PEP и их валидаторы."""
+
+    def __init__(self, path):
+        self.path = path
+        self.unchanged = 0
+        self._lock = Lock()
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.cards = json.load(f)
+        except FileNotFoundError:
+            self.cards = {}
+
+    def conditional_headers(self, url):
+        card = self.cards.get(url, {})
+        headers = {}
+        if card.get("etag"):
+            headers["If-None-Match"] = card["etag"]
+        if card.get("last_modified"):
+            headers["If-Modified-Since"] = card["last_modified"]
+        return headers
+
+    def unchanged_status(self, url):
+        with self._lock:
+            self.unchanged += 1
+        return self.cards[url]["status"]
+
+    def update(self, url, status, response_headers):
+        with self._lock:
+            self.cards[url] = {
+                "status": status,
+                "etag": response_headers.get("ETag"),
+                "last_modified": response_headers.get("Last-Modified"),
+            }
+
+    def save(self):
+        with self._lock:
+            cards = dict(self.cards)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cards, f, ensure_ascii=False, indent=1, sort_keys=True)
+        tmp_path.replace(self.path)
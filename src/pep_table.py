@@ -0,0 +1,105 @@
+from collections import Counter
+from functools import cached_property
+from itertools import compress
+from operator import itemgetter
+
+from records import CategoryRow, ConfusionRow, PepIndexRow, StatusRow
+
+COLUMNS = (
+    "number", "url", "type", "index_status", "card_status", "category",
+    "expected_status",
+)
+COMBINATION_COLUMNS = (
+    "category", "index_status", "card_status", "expected_status"
+)
+TOTAL = "Всего"
+STATUSES_HEADER = ("Статус", "Количество")
+CONFUSION_HEADER = (
+    "Статус в индексе", "Статус в карточке", "Количество", "Ожидаемый"
+)
+CATEGORIES_HEADER = ("Категория", "Статус", "Количество")
+
+
+class PepTable:
+    """Собранные данные о PEP, сложенные по столбцам.
+
+    Столбцы загруженных карточек и счётчик сочетаний категории и статусов
+    считаются один раз, при первом обращении; отчёты складывают готовый
+    счётчик по нужным столбцам и не обходят строки заново.
+    """
+
+    def __init__(self):
+        self.columns = {column: [] for column in COLUMNS}
+
+    def __len__(self):
+        return len(self.columns["url"])
+
+    def append(self, record, card_status):
+        row = {**record._asdict(), "card_status": card_status}
+        for column, values in self.columns.items():
+            values.append(row[column])
+        self.__dict__.pop("fetched", None)
+        self.__dict__.pop("combinations", None)
+
+    @cached_property
+    def fetched(self):
+        mask = [status is not None for status in self.columns["card_status"]]
+        return {
+            column: list(compress(values, mask))
+            for column, values in self.columns.items()
+        }
+
+    @cached_property
+    def combinations(self):
+        return Counter(self.fetched_columns(*COMBINATION_COLUMNS))
+
+    def fetched_columns(self, *columns):
+        return zip(*(self.fetched[column] for column in columns))
+
+    def combination_counts(self, *columns):
+        key = itemgetter(*map(COMBINATION_COLUMNS.index, columns))
+        counts = Counter()
+        for combination, count in self.combinations.items():
+            counts[key(combination)] += count
+        return counts
+
+    def mismatched(self):
+        return [
+            (url, status, expected)
+            for url, status, expected in self.fetched_columns(
+                "url", "card_status", "expected_status"
+            )
+            if status not in expected
+        ]
+
+    def records(self):
+        return list(map(
+            PepIndexRow._make,
+            zip(*(self.columns[column] for column in PepIndexRow._fields))
+        ))
+
+    def statuses(self):
+        counts = self.combination_counts("card_status")
+        return [
+            STATUSES_HEADER,
+            *map(StatusRow._make, counts.items()),
+            StatusRow(TOTAL, sum(counts.values())),
+        ]
+
+    def confusion(self):
+        counts = self.combination_counts(
+            "index_status", "card_status", "expected_status"
+        )
+        return [CONFUSION_HEADER, *(
+            ConfusionRow(index_status, card_status, count,
+                         card_status in expected)
+            for (index_status, card_status, expected), count
+            in sorted(counts.items())
+        )]
+
+    def categories(self):
+        counts = self.combination_counts("category", "card_status")
+        return [CATEGORIES_HEADER, *(
+            CategoryRow(category, card_status, count)
+            for (category, card_status), count in counts.items()
+        )]
@@ -0,0 +1,101 @@
+import cProfile
+import pstats
+import sys
+import threading
+from collections import defaultdict
+
+SUBSYSTEM_OTHER = "прочее"
+SUBSYSTEMS = (
+    ("HTTP", (
+        "requests/", "urllib3/", "http/client.py", "ssl", "socket",
+        "requests_mock/", "transport.py:", "archives.py:",
+        "utils.py:get_response()",
+    )),
+    ("кеш", (
+        "requests_cache/", "cattrs/", "sqlite3", "pickle",
+        "parse_cache.py:", "pep_state.py:",
+    )),
+    ("выборка", (
+        "soupsieve/", "bs4/element.py:find", "bs4/element.py:_find",
+        "bs4/element.py:select", "bs4/css.py:",
+        "utils.py:find_tag()", "utils.py:select",
+    )),
+    ("разбор", (
+        "bs4/", "lxml", "html5lib/", "html/parser.py", "utils.py:",
+    )),
+    ("вывод", (
+        "outputs.py:", "prettytable/", "csv", "pyarrow", "json/", "gzip",
+    )),
+)
+# С Python 3.12 cProfile работает через sys.monitoring: один профайлер
+# охватывает все потоки, а второй включить нельзя.
+PROCESS_WIDE_PROFILE = sys.version_info >= (3, 12)
+SUMMARY_HEADER = ("Подсистема", "Вызовов", "Собственное время, с", "Доля, %")
+TOP_HEADER = (
+    "Функция", "Подсистема", "Вызовов", "Собственное время, с",
+    "Суммарное время, с"
+)
+
+
+def profile_call(func, *args, **kwargs):
+    profiles = [cProfile.Profile()]
+
+    def start_thread_profile(*_):
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            sys.setprofile(None)
+            return
+        profiles.append(profile)
+
+    if not PROCESS_WIDE_PROFILE:
+        threading.setprofile(start_thread_profile)
+    profiles[0].enable()
+    try:
+        func(*args, **kwargs)
+    finally:
+        profiles[0].disable()
+        threading.setprofile(None)
+    return pstats.Stats(*profiles)
+
+
+def function_name(key):
+    filename, line, name = key
+    return "{}:{}()".format(filename.replace("\\", "/"), name)
+
+
+def subsystem(key):
+    name = function_name(key)
+    for title, markers in SUBSYSTEMS:
+        if any(marker in name for marker in markers):
+            return title
+    return SUBSYSTEM_OTHER
+
+
+def subsystem_rows(stats):
+    calls = defaultdict(int)
+    own_time = defaultdict(float)
+    for key, (_, total_calls, tottime, _, _) in stats.stats.items():
+        title = subsystem(key)
+        calls[title] += total_calls
+        own_time[title] += tottime
+    total = sum(own_time.values()) or 1
+    return [
+        (title, calls[title], round(seconds, 4),
+         round(100 * seconds / total, 1))
+        for title, seconds in sorted(
+            own_time.items(), key=lambda item: item[1], reverse=True
+        )
+    ]
+
+
+def top_rows(stats, top):
+    functions = sorted(
+        stats.stats.items(), key=lambda item: item[1][2], reverse=True
+    )[:top]
+    return [
+        (pstats.func_std_string(key), subsystem(key), total_calls,
+         round(tottime, 4), round(cumtime, 4))
+        for key, (_, total_calls, tottime, cumtime, _) in functions
+    ]
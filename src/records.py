@@ -0,0 +1,55 @@
+from typing import NamedTuple, Optional, Tuple
+
+
+class WhatsNewRow(NamedTuple):
+    link: str
+    title: str
+    editor: str
+
+
+class VersionRow(NamedTuple):
+    link: str
+    version: str
+    status: str
+
+
+class PepRecord(NamedTuple):
+    url: str
+    expected_status: Tuple[str, ...]
+    number: int
+    type: str
+    index_status: str
+    category: str
+
+
+class PepIndexRow(NamedTuple):
+    number: int
+    url: str
+    type: str
+    index_status: str
+    card_status: Optional[str]
+    category: str
+
+
+class StatusRow(NamedTuple):
+    status: str
+    count: int
+
+
+class StatusTypeRow(NamedTuple):
+    status: str
+    type: str
+    count: int
+
+
+class ConfusionRow(NamedTuple):
+    index_status: str
+    card_status: str
+    count: int
+    expected: bool
+
+
+class CategoryRow(NamedTuple):
+    category: str
+    card_status: str
+    count: int
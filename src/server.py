@@ -0,0 +1,118 @@
+import json
+import logging
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Event, Lock, Thread
+from urllib.parse import urlsplit
+
+SERVER_STARTED = "Сервер запущен: http://{host}:{port}/"
+SERVER_STOPPED = "Сервер остановлен"
+REFRESH_ERROR = "Не удалось обновить режим {mode}: {error}"
+SNAPSHOT_NOT_READY = "Данные режима {mode} ещё не получены"
+
+
+class SnapshotHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        mode = urlsplit(self.path).path.strip("/")
+        if not mode:
+            return self.send_json(HTTPStatus.OK, self.server.snapshots_info())
+        if mode not in self.server.modes:
+            return self.send_json(
+                HTTPStatus.NOT_FOUND, {"modes": self.server.modes}
+            )
+        snapshot = self.server.snapshot(mode)
+        if snapshot is None:
+            return self.send_json(
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                {"error": SNAPSHOT_NOT_READY.format(mode=mode)}
+            )
+        return self.send_json(HTTPStatus.OK, snapshot)
+
+    def send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.debug(format, *args)
+
+
+class SnapshotServer(ThreadingHTTPServer):
+    """HTTP-сервер, отдающий последний успешный результат каждого режима.
+
+    Результаты обновляются в фоновом потоке раз в refresh_interval секунд,
+    сессия и кеши остаются в памяти между обновлениями.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, refresh, modes, refresh_interval):
+        super().__init__(address, SnapshotHandler)
+        self.refresh = refresh
+        self.modes = modes
+        self.refresh_interval = refresh_interval
+        self.refreshed = Event()
+        self._stopped = Event()
+        self._snapshots = {}
+        self._lock = Lock()
+        self._refresher = Thread(target=self.refresh_loop, daemon=True)
+
+    def snapshot(self, mode):
+        with self._lock:
+            return self._snapshots.get(mode)
+
+    def snapshots_info(self):
+        with self._lock:
+            return {
+                mode: snapshot["updated_at"]
+                for mode, snapshot in self._snapshots.items()
+            }
+
+    def refresh_modes(self):
+        for mode in self.modes:
+            try:
+                results = self.refresh(mode)
+            except Exception as e:
+                logging.exception(REFRESH_ERROR.format(mode=mode, error=e))
+                continue
+            if results is None:
+                continue
+            header, *rows = results
+            with self._lock:
+                self._snapshots[mode] = {
+                    "mode": mode,
+                    "updated_at": datetime.now().isoformat(),
+                    "header": header,
+                    "rows": rows,
+                }
+        self.refreshed.set()
+
+    def refresh_loop(self):
+        while not self._stopped.is_set():
+            self.refresh_modes()
+            self._stopped.wait(self.refresh_interval)
+
+    def start_refresh(self):
+        self._refresher.start()
+
+    def server_close(self):
+        self._stopped.set()
+        super().server_close()
+
+
+def serve(refresh, modes, host, port, refresh_interval):
+    with SnapshotServer(
+        (host, port), refresh, modes, refresh_interval
+    ) as server:
+        server.start_refresh()
+        logging.info(SERVER_STARTED.format(
+            host=host, port=server.server_address[1]
+        ))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logging.info(SERVER_STOPPED)
@@ -0,0 +1,68 @@
+import time
+from threading import Lock
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from constants import RETRY_BACKOFF_FACTOR, RETRY_STATUSES
+
+
+class TokenBucket:
+    """Ограничивает частоту операций: rate токенов в секунду."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = Lock()
+
+    def reserve(self, tokens=1):
+        with self._lock:
+            now = time.monotonic()
+            refill = (now - self.updated_at) * self.rate
+            self.tokens = min(self.capacity, self.tokens + refill)
+            self.updated_at = now
+            self.tokens -= tokens
+            return -self.tokens / self.rate if self.tokens < 0 else 0
+
+    def acquire(self, tokens=1):
+        if delay := self.reserve(tokens):
+            time.sleep(delay)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTP-адаптер с пулом соединений, повторами, таймаутом по умолчанию
+    и ограничением частоты запросов к каждому хосту."""
+
+    def __init__(self, pool_size, timeout, retries, rate_limit=None):
+        self.timeout = timeout
+        self.rate_limit = rate_limit
+        self._buckets = {}
+        self._buckets_lock = Lock()
+        super().__init__(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=("GET", "HEAD"),
+            ),
+        )
+
+    def bucket(self, host):
+        with self._buckets_lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate_limit)
+            return self._buckets[host]
+
+    def send(self, request, timeout=None, **kwargs):
+        if self.rate_limit:
+            self.bucket(urlsplit(request.url).netloc).acquire()
+        return super().send(
+            request,
+            timeout=self.timeout if timeout is None else timeout,
+            **kwargs
+        )
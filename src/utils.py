@@ -1,23 +1,52 @@
-from bs4 import BeautifulSoup
-from requests import RequestException
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 
 from exceptions import ParserFindTagException
+from metrics import METRICS
+from parse_pool import run_parse
 
 RESPONSE_ERROR = 'Возникла ошибка при загрузке страницы {url}: {exc}'
 TAG_NOT_FOUND = 'Не найден тег {tag} {message_attrs}'
+NO_XPATH = 'Для селектора {css} не задан XPath и не установлен cssselect'
 
+STREAM_CHUNK_SIZE = 8 * 1024
 
-def get_response(session, url, encoding='utf-8'):
+
+@METRICS.timed_function('get_response')
+def get_response(session, url, encoding='utf-8', **kwargs):
+    from requests import RequestException
     try:
-        response = session.get(url)
+        response = session.get(url, **kwargs)
         response.encoding = encoding
-        return response
     except RequestException as exc:
         raise ConnectionError(
             RESPONSE_ERROR.format(url=url, exc=exc)
         ) from exc
+    count_response(response, kwargs.get('stream', False))
+    return response
+
+
+def count_response(response, stream):
+    if not METRICS.enabled:
+        return
+    if getattr(response, 'from_cache', False):
+        METRICS.count('http_cache_hits')
+        return
+    METRICS.count('http_cache_misses')
+    if length := response.headers.get('Content-Length'):
+        METRICS.count('bytes_transferred', int(length))
+    elif not stream:
+        METRICS.count('bytes_transferred', len(response.content))
 
 
+def count_parsed(text):
+    if METRICS.enabled:
+        METRICS.count('bytes_parsed', len(
+            text.encode('utf-8') if isinstance(text, str) else text
+        ))
+
+
+@METRICS.timed_function('find_tag')
 def find_tag(soup, tag, attrs=None):
     attrs_to_search = {} if attrs is None else attrs
     searched_tag = soup.find(tag, attrs=attrs_to_search)
@@ -29,5 +58,134 @@ def find_tag(soup, tag, attrs=None):
     return searched_tag
 
 
-def get_soup(session, url, parser="lxml"):
-    return BeautifulSoup(get_response(session, url).text, parser)
+def find_tag_streamed(session, url, tag, encoding='utf-8',
+                      chunk_size=STREAM_CHUNK_SIZE):
+    response = get_response(session, url, encoding, stream=True)
+    return find_tag_in_stream(response, url, tag, encoding, chunk_size)
+
+
+@METRICS.timed_function('stream_parse')
+def find_tag_in_stream(response, url, tag, encoding='utf-8',
+                       chunk_size=STREAM_CHUNK_SIZE):
+    from lxml import etree
+    from requests import RequestException
+    parser = etree.HTMLPullParser(events=('end',), tag=tag, encoding=encoding)
+    try:
+        with response:
+            for chunk in response.iter_content(chunk_size):
+                count_parsed(chunk)
+                parser.feed(chunk)
+                for _, element in parser.read_events():
+                    return ''.join(element.itertext())
+    except RequestException as exc:
+        raise ConnectionError(
+            RESPONSE_ERROR.format(url=url, exc=exc)
+        ) from exc
+    raise ParserFindTagException(
+        TAG_NOT_FOUND.format(tag=tag, message_attrs=None)
+    )
+
+
+def get_parsed(session, url, parse, parse_cache=None, parse_pool=None,
+               **kwargs):
+    response = get_response(session, url, **kwargs)
+    if parse_cache is None:
+        return run_parse(parse, response, parse_pool)
+    return parse_cache.get_or_parse(response, parse, parse_pool)
+
+
+def get_soup(session, url, parser="lxml", parse_only=None):
+    return make_soup(get_response(session, url).text, parser, parse_only)
+
+
+@METRICS.timed_function('get_soup')
+def make_soup(text, parser="lxml", parse_only=None):
+    from bs4 import BeautifulSoup, SoupStrainer
+    strainer = None if parse_only is None else SoupStrainer(**parse_only)
+    count_parsed(text)
+    return BeautifulSoup(text, parser, parse_only=strainer)
+
+
+@METRICS.timed_function('get_tree')
+def make_tree(text):
+    from lxml import html
+    count_parsed(text)
+    return html.document_fromstring(text)
+
+
+def css_to_xpath(css):
+    try:
+        from cssselect import HTMLTranslator
+    except ImportError:
+        return None
+    return HTMLTranslator().css_to_xpath(css)
+
+
+def is_tree_node(node):
+    from lxml import etree
+    return etree.iselement(node)
+
+
+class Selector:
+    """CSS-селектор, компилируемый один раз при первом использовании.
+
+    На деревьях lxml выполняется как XPath (заданный явно или полученный
+    через cssselect), на супе BeautifulSoup — скомпилированным soupsieve.
+    """
+
+    def __init__(self, css, xpath=None):
+        self.css = css
+        self.xpath_source = xpath
+
+    @cached_property
+    def soup_selector(self):
+        import soupsieve
+        return soupsieve.compile(self.css)
+
+    @cached_property
+    def xpath(self):
+        from lxml import etree
+        xpath = self.xpath_source or css_to_xpath(self.css)
+        if xpath is None:
+            raise ValueError(NO_XPATH.format(css=self.css))
+        return etree.XPath(xpath)
+
+    def select(self, node):
+        if not is_tree_node(node):
+            return self.soup_selector.select(node)
+        return self.xpath(node)
+
+    def select_one(self, node):
+        if not is_tree_node(node):
+            return self.soup_selector.select_one(node)
+        return next(iter(self.xpath(node)), None)
+
+
+@METRICS.timed_function('select')
+def select(node, selector):
+    return selector.select(node)
+
+
+@METRICS.timed_function('select')
+def select_one(node, selector):
+    return selector.select_one(node)
+
+
+def select_tag(node, selector):
+    searched_tag = select_one(node, selector)
+    if searched_tag is None:
+        error_message = TAG_NOT_FOUND.format(
+            tag=selector.css, message_attrs=''
+        )
+        raise ParserFindTagException(error_message)
+    return searched_tag
+
+
+def node_text(node):
+    return node.text_content() if is_tree_node(node) else node.text
+
+
+def map_ordered(func, items, workers=1):
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        yield from futures
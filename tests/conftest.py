@@ -1,10 +1,11 @@
 import pytest
 import sys
+import time
 from pathlib import Path
 from bs4 import BeautifulSoup
 import requests_mock
 from argparse import Namespace
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 from requests_cache import CachedSession, ALL_METHODS
 from requests_mock import Adapter
@@ -67,6 +68,39 @@ def mount_mock_adapter(session: CachedSession) -> CachedSession:
     return session
 
 
+def get_pages_adapter(pages: Dict[str, str], latency: float = 0) -> Adapter:
+    def page_callback(body):
+        def callback(request, context):
+            time.sleep(latency)
+            return body
+        return callback
+
+    adapter = Adapter()
+    for url, body in pages.items():
+        adapter.register_uri(
+            'GET',
+            url,
+            headers={'Content-Type': 'text/html; charset=utf-8'},
+            text=page_callback(body),
+            status_code=200,
+        )
+    return adapter
+
+
+@pytest.fixture
+def pages_session():
+    def _pages_session(pages: Dict[str, str], latency: float = 0):
+        session = CachedSession(
+            backend='memory',
+            allowable_methods=ALL_METHODS,
+        )
+        adapter = get_pages_adapter(pages, latency)
+        session.mount('https://', adapter)
+        session.mock_adapter = adapter
+        return session
+    return _pages_session
+
+
 @pytest.fixture(scope='function')
 def mock_session(tempfile_session) -> CachedSession:
     yield mount_mock_adapter(tempfile_session)
@@ -110,3 +144,9 @@ def records():
         result = results[mode]
         return converting(result)
     return _records
+
+
+@pytest.fixture
+def recorded_session(pages_session):
+    from tests.fixture_data.recorded import recorded_pages
+    return pages_session(recorded_pages())
@@ -0,0 +1,46 @@
+"""Синтетические страницы docs.python.org и peps.python.org.
+
+Разметка повторяет настоящие сайты, но страницы сгенерированы офлайн,
+а не записаны с сайтов; все карточки PEP собираются из нескольких образцов.
+"""
+import re
+from pathlib import Path
+from typing import Dict
+
+PAGES_DIR = Path(__file__).parent / 'pages'
+
+MAIN_DOC_URL = 'https://docs.python.org/3/'
+PEP_URL = 'https://peps.python.org/'
+WHATS_NEW_VERSIONS = ('3.12', '3.11', '3.10', '3.9', '3.8', '3.7')
+PEP_ROW_PATTERN = re.compile(
+    r'<abbr title="[^"]*">(?P<abbr>\w*)</abbr></td>'
+    r'<td><a class="pep reference internal" href="pep-(?P<number>\d{4})/"'
+)
+
+
+def read_page(name: str) -> str:
+    return (PAGES_DIR / name).read_text(encoding='utf-8')
+
+
+def recorded_pages() -> Dict[str, str]:
+    pages = {
+        MAIN_DOC_URL: read_page('docs_index.html'),
+        MAIN_DOC_URL + 'whatsnew/': read_page('whatsnew_index.html'),
+        MAIN_DOC_URL + 'download.html': read_page('download.html'),
+        PEP_URL: read_page('pep_index.html'),
+    }
+    for version in WHATS_NEW_VERSIONS:
+        pages[f'{MAIN_DOC_URL}whatsnew/{version}.html'] = read_page(
+            f'whatsnew_{version}.html'
+        )
+    pep_rows = {
+        match['number']: match['abbr']
+        for match in PEP_ROW_PATTERN.finditer(pages[PEP_URL])
+    }
+    sample_cards = {
+        pep_rows[card.stem[4:]]: card.read_text(encoding='utf-8')
+        for card in PAGES_DIR.glob('pep-*.html')
+    }
+    for number, abbr in pep_rows.items():
+        pages[f'{PEP_URL}pep-{number}/'] = sample_cards[abbr]
+    return pages
@@ -0,0 +1,108 @@
+import base64
+import hashlib
+
+import pytest
+try:
+    from src import archives
+except (ModuleNotFoundError, ImportError):
+    assert False, 'Убедитесь что в директории `src` есть файл `archives.py`'
+
+ARCHIVE_URL = 'https://docs.python.org/3/archives/docs-pdf-a4.zip'
+ARCHIVE = bytes(range(256)) * 1000
+ARCHIVE_ETAG = '"archive-v1"'
+
+
+def archive_callback(requested, body=ARCHIVE, digest=True,
+                     etag=ARCHIVE_ETAG):
+    def callback(request, context):
+        requested.append(request.headers.get('Range'))
+        context.headers['ETag'] = etag
+        if digest:
+            context.headers['Digest'] = 'sha-256=' + base64.b64encode(
+                hashlib.sha256(body).digest()
+            ).decode()
+        range_header = request.headers.get('Range')
+        if range_header and request.headers.get('If-Range') == etag:
+            start = int(range_header[len('bytes='):-1])
+            context.status_code = 206
+            context.headers['Content-Range'] = (
+                f'bytes {start}-{len(body) - 1}/{len(body)}'
+            )
+            return body[start:]
+        return body
+    return callback
+
+
+@pytest.fixture
+def archive_session(pages_session):
+    session = pages_session({})
+    requested = []
+    session.mock_adapter.register_uri(
+        'GET', ARCHIVE_URL, content=archive_callback(requested)
+    )
+    session.requested = requested
+    return session
+
+
+def test_download_archive(tmp_path, archive_session):
+    path = tmp_path / 'docs-pdf-a4.zip'
+    checksum = archives.download_archive(
+        archive_session, ARCHIVE_URL, path, chunk_size=1000
+    )
+    assert path.read_bytes() == ARCHIVE
+    assert checksum == hashlib.sha256(ARCHIVE).hexdigest()
+    assert not list(tmp_path.glob('*.part')), (
+        'Временный файл должен переименовываться после загрузки'
+    )
+
+
+def write_part(tmp_path, body, validator=ARCHIVE_ETAG):
+    (tmp_path / 'docs-pdf-a4.zip.part').write_bytes(body)
+    if validator is not None:
+        (tmp_path / 'docs-pdf-a4.zip.part.etag').write_text(validator)
+
+
+def test_download_archive_resume(tmp_path, archive_session):
+    path = tmp_path / 'docs-pdf-a4.zip'
+    write_part(tmp_path, ARCHIVE[:1000])
+    archives.download_archive(archive_session, ARCHIVE_URL, path)
+    assert archive_session.requested == ['bytes=1000-'], (
+        'Загрузка должна продолжаться с места обрыва'
+    )
+    assert path.read_bytes() == ARCHIVE
+
+
+def test_download_archive_corrupted(tmp_path, archive_session):
+    path = tmp_path / 'docs-pdf-a4.zip'
+    write_part(tmp_path, b'x' * 1000)
+    with pytest.raises(archives.DownloadError):
+        archives.download_archive(archive_session, ARCHIVE_URL, path)
+    assert not path.exists(), (
+        'Повреждённый архив не должен сохраняться под итоговым именем'
+    )
+
+
+@pytest.mark.parametrize('validator', ['"archive-v0"', None])
+def test_download_archive_restart(tmp_path, archive_session, validator):
+    path = tmp_path / 'docs-pdf-a4.zip'
+    write_part(tmp_path, b'x' * 1000, validator)
+    archives.download_archive(archive_session, ARCHIVE_URL, path)
+    assert path.read_bytes() == ARCHIVE, (
+        'Архив, изменившийся на сервере или без сохранённого валидатора, '
+        'должен загружаться заново с начала'
+    )
+    assert archive_session.requested == [
+        None if validator is None else 'bytes=1000-'
+    ]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        path.name, path.name + '.etag'
+    ], 'Временный файл и его валидатор должны удаляться после загрузки'
+
+
+def test_download_archive_not_cached(tmp_path, archive_session):
+    archives.download_archive(
+        archive_session, ARCHIVE_URL, tmp_path / 'docs-pdf-a4.zip'
+    )
+    assert not list(archive_session.cache.responses.keys()), (
+        'Архивы не должны попадать в HTTP-кеш'
+    )
@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from requests_cache import CachedSession
+
+try:
+    from src import main
+except (ModuleNotFoundError, ImportError):
+    assert False, 'Убедитесь что в директории `src` есть файл `main.py`'
+
+pytest.importorskip('aiohttp')
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        body = server.pages.get(self.path)
+        with server.lock:
+            server.requests += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        time.sleep(server.latency)
+        with server.lock:
+            server.in_flight -= 1
+        if body is None:
+            self.send_error(404)
+            return
+        body = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    from tests.fixture_data.recorded import (MAIN_DOC_URL, PEP_URL,
+                                             recorded_pages)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.lock = threading.Lock()
+    server.requests = server.in_flight = server.max_in_flight = 0
+    server.latency = 0.01
+    server.pages = {}
+    for url, body in recorded_pages().items():
+        path = url.replace(MAIN_DOC_URL, '/docs/3/').replace(PEP_URL, '/')
+        server.pages[path] = body.replace(PEP_URL, '/')
+    base_url = 'http://127.0.0.1:{}/'.format(server.server_port)
+    monkeypatch.setattr(main, 'MAIN_DOC_URL', base_url + 'docs/3/')
+    monkeypatch.setattr(main, 'PEP_URL', base_url)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def run_async(session, mode_function, concurrency=8, retries=1, **kwargs):
+    from async_http import AsyncClient
+
+    async def run_client():
+        async with AsyncClient(
+            session, concurrency, workers=2, retries=retries
+        ) as client:
+            return await mode_function(client, **kwargs)
+    return asyncio.run(run_client())
+
+
+@pytest.mark.parametrize('mode', ['whats-new', 'pep'])
+def test_async_parity(stub_server, mode):
+    expected = list(main.MODE_TO_FUNCTION[mode](
+        CachedSession(backend='memory'), workers=4
+    ))
+    got = run_async(
+        CachedSession(backend='memory'), main.ASYNC_MODE_TO_FUNCTION[mode]
+    )
+    assert len(expected) > 1 and got == expected, (
+        f'Асинхронный движок должен возвращать те же строки режима `{mode}`'
+    )
+
+
+def test_async_shared_cache(stub_server, tmp_path):
+    cache_name = tmp_path / 'http_cache'
+    run_async(CachedSession(cache_name), main.async_whats_new)
+    fetched = stub_server.requests
+    got = list(main.whats_new(CachedSession(cache_name)))
+    run_async(CachedSession(cache_name), main.async_whats_new)
+    assert fetched > 1 and stub_server.requests == fetched, (
+        'Ответы асинхронного движка должны сохраняться в общем HTTP-кеше '
+        'и читаться обоими движками'
+    )
+    assert len(got) > 1
+
+
+def test_async_concurrency_limit(stub_server):
+    run_async(
+        CachedSession(backend='memory'), main.async_pep, concurrency=3
+    )
+    assert 1 < stub_server.max_in_flight <= 3, (
+        'Число одновременных запросов должно ограничиваться семафором'
+    )
+
+
+def test_async_connection_error(stub_server):
+    async def get(url, client):
+        return await client.get(url)
+
+    missing = 'http://127.0.0.1:{}/missing'.format(stub_server.server_port)
+    response = run_async(CachedSession(backend='memory'), partial(get, missing))
+    assert response.status_code == 404, (
+        'Ответ с ошибкой HTTP должен возвращаться как есть'
+    )
+    with pytest.raises(ConnectionError):
+        run_async(
+            CachedSession(backend='memory'),
+            partial(get, 'http://127.0.0.1:1/'),
+            retries=0
+        )
+
+
+def test_run_mode_async_engine(stub_server, tmp_path, monkeypatch):
+    monkeypatch.setattr(main, 'BASE_DIR', tmp_path)
+    parser = main.configure_argument_parser(list(main.MODE_TO_FUNCTION))
+    args = parser.parse_args(['pep', '--engine', 'async', '--incremental'])
+    session = CachedSession(backend='memory')
+    first = main.run_mode(session, args, None, 'pep')
+    fetched = stub_server.requests
+    second = main.run_mode(session, args, None, 'pep')
+    assert first == second and first[-1][0] == 'Всего', (
+        'Режим pep должен выполняться асинхронным движком по флагу `--engine`'
+    )
+    assert stub_server.requests == 2 * fetched, (
+        'В инкрементальном режиме запросы должны идти мимо HTTP-кеша'
+    )
+
+
+@pytest.mark.parametrize('headers, saved', [
+    ({'ETag': '"1"'}, False),
+    ({'ETag': '"1"', 'X-Version': '2'}, True),
+])
+def test_async_revalidated_response(headers, saved):
+    from async_http import AsyncClient, make_response
+    from requests import Request
+    from requests_cache.policy import CacheActions
+    session = CachedSession(backend='memory')
+    url = 'http://127.0.0.1:1/'
+    request = session.prepare_request(Request('GET', url))
+    key = session.cache.create_key(request)
+    session.cache.save_response(
+        make_response(request, url, 200, 'OK', {'ETag': '"1"'}, b'body'), key
+    )
+    cached_response = session.cache.get_response(key)
+
+    async def send(request):
+        return make_response(request, url, 304, 'Not Modified', headers, b'')
+
+    async def revalidate():
+        async with AsyncClient(session, 1) as client:
+            client.send = send
+            actions = CacheActions.from_request(key, request, session.settings)
+            actions.update_from_cached_response(
+                cached_response, session.cache.create_key
+            )
+            return await client.send_and_cache(
+                request, actions, cached_response
+            )
+
+    response = asyncio.run(revalidate())
+    assert response.content == b'body' and response.revalidated
+    stored = session.cache.get_response(key)
+    assert ('X-Version' in stored.headers) == saved, (
+        'После ответа 304 запись кеша должна обновляться только при '
+        'изменившихся заголовках или сроке жизни'
+    )
@@ -0,0 +1,66 @@
+import pytest
+
+try:
+    from src import backends, main
+except (ModuleNotFoundError, ImportError):
+    assert False, 'Убедитесь что в директории `src` есть файл `backends.py`'
+
+
+@pytest.mark.parametrize('mode', ['whats-new', 'latest-versions', 'pep'])
+def test_backend_parity(pages_session, mode):
+    from tests.fixture_data.recorded import recorded_pages
+    pages = recorded_pages()
+    got = {
+        name: list(main.MODE_TO_FUNCTION[mode](
+            pages_session(pages), workers=4, backend=backend
+        ))
+        for name, backend in backends.BACKENDS.items()
+    }
+    assert len(got['bs4']) > 1 and got['bs4'] == got['lxml'], (
+        f'Режим `{mode}` должен давать одинаковый результат '
+        'с разборщиками BeautifulSoup и lxml'
+    )
+
+
+@pytest.mark.parametrize('broken_page', ['', '\x00garbage<<'])
+def test_backend_parity_broken_page(pages_session, caplog, broken_page):
+    from tests.fixture_data.recorded import MAIN_DOC_URL, recorded_pages
+    pages = recorded_pages()
+    broken_url = f'{MAIN_DOC_URL}whatsnew/3.9.html'
+    pages[broken_url] = broken_page
+    got = {}
+    for name, backend in backends.BACKENDS.items():
+        caplog.clear()
+        got[name] = list(main.whats_new(pages_session(pages), backend=backend))
+        assert any(broken_url in message for message in caplog.messages), (
+            'Ошибка разбора страницы должна попадать в лог'
+        )
+    assert len(got['lxml']) == 6 and got['bs4'] == got['lxml'], (
+        'Пустая или повреждённая страница должна пропускаться '
+        'обоими разборщиками без остановки режима'
+    )
+
+
+@pytest.mark.parametrize('name', list(backends.BACKENDS))
+def test_backend_operations(name):
+    backend = backends.BACKENDS[name]
+    page = backend.parse(
+        '<html><body><div class="a b"><p>one <b>two</b></p><p>three</p>'
+        '</div></body></html>'
+    )
+    div = backend.find(page, 'div', attrs={'class': 'b'})
+    assert [backend.text(p) for p in backend.find_all(div, 'p')] == [
+        'one two', 'three'
+    ]
+    with pytest.raises(BaseException) as excinfo:
+        backend.find(page, 'div', attrs={'class': 'c'})
+    assert excinfo.typename == 'ParserFindTagException', (
+        'Разборщик должен выбрасывать ParserFindTagException, '
+        'если тег не найден'
+    )
+
+
+def test_default_backend():
+    assert backends.DEFAULT_BACKEND is backends.BACKENDS['lxml'], (
+        'По умолчанию должен использоваться более быстрый разборщик lxml'
+    )
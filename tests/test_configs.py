@@ -1,5 +1,6 @@
 import pytest
 import argparse
+from requests_cache import SQLiteCache
 try:
     from src import configs
 except ModuleNotFoundError:
@@ -29,7 +30,7 @@ def test_configs_file():
     ),
     (
         argparse._StoreAction, ['-o', '--output'], 'output',
-        ('pretty', 'file'),
+        ('pretty', 'file', 'jsonl', 'arrow', 'parquet'),
         'Дополнительные способы вывода данных'
     ),
 ])
@@ -64,3 +65,73 @@ def test_configure_argument_parser(
     assert got_action.help == help_str, (
         f'Укажите help-строку cli аргумента {got_action.dest}'
     )
+
+
+def test_configure_session():
+    parser = configs.configure_argument_parser(['pep'])
+    args = parser.parse_args([
+        'pep', '--cache-backend', 'memory', '--expire-after', '60',
+        '--expire', 'peps.python.org/pep-*=10', '--stale-while-revalidate',
+    ])
+    session = configs.configure_session(args)
+    assert not isinstance(session.cache, SQLiteCache), (
+        'Хранилище кеша должно выбираться аргументом `--cache-backend`'
+    )
+    settings = session.settings
+    assert settings.expire_after == 60
+    assert settings.stale_while_revalidate is True
+    assert list(settings.urls_expire_after.items())[0] == (
+        'peps.python.org/pep-*', 10
+    ), 'Правила из командной строки должны иметь приоритет'
+    assert 'peps.python.org/' in settings.urls_expire_after, (
+        'Правила по умолчанию должны сохраняться'
+    )
+
+
+@pytest.mark.parametrize('rule', ['peps.python.org', '300', '=300'])
+def test_expire_rule_error(rule):
+    parser = configs.configure_argument_parser(['pep'])
+    with pytest.raises(SystemExit):
+        parser.parse_args(['pep', '--expire', rule])
+
+
+@pytest.mark.parametrize('value, valid', [
+    ('0', True),
+    ('1000', True),
+    ('-1', False),
+])
+def test_parse_cache_size(value, valid):
+    parser = configs.configure_argument_parser(['pep'])
+    argv = ['pep', '--parse-cache-size', value]
+    if valid:
+        assert parser.parse_args(argv).parse_cache_size == int(value)
+        return
+    with pytest.raises(SystemExit):
+        parser.parse_args(argv)
+
+
+@pytest.mark.parametrize('output, compression, valid', [
+    ('arrow', 'zstd', True),
+    ('arrow', 'snappy', False),
+    ('jsonl', 'zstd', False),
+    ('parquet', 'brotli', True),
+])
+def test_validate_compression(output, compression, valid):
+    parser = configs.configure_argument_parser(['pep'])
+    argv = ['pep', '-o', output, '--compression', compression]
+    if valid:
+        configs.validate_args(parser, parser.parse_args(argv))
+        return
+    with pytest.raises(SystemExit):
+        configs.validate_args(parser, parser.parse_args(argv))
+
+
+def test_processes_raise_workers():
+    parser = configs.configure_argument_parser(['pep'])
+    args = configs.validate_args(
+        parser, parser.parse_args(['pep', '--processes', '4'])
+    )
+    assert args.workers == 4, (
+        'Число потоков загрузки должно быть не меньше числа процессов '
+        'разбора, иначе пул процессов простаивает'
+    )
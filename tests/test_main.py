@@ -1,5 +1,10 @@
+import inspect
+import time
+
 import pytest
 from pathlib import Path
+
+from conftest import MAIN_DOC_URL
 try:
     from src import main
 except ModuleNotFoundError:
@@ -33,9 +38,10 @@ def test_main_file():
 def test_whats_new(mock_session):
     got = main.whats_new(mock_session)
     header = ('Ссылка на статью', 'Заголовок', 'Редактор, автор')
-    assert isinstance(got, list), (
-        'Функция `whats_new` должна возвращать объект типа `list`'
+    assert inspect.isgenerator(got), (
+        'Функция `whats_new` должна быть генератором строк результата'
     )
+    got = list(got)
     assert len(got) > 0, (
         'Убедитесь что функция `whats_new` модуля `main.py` '
         'возвращает непустой список'
@@ -54,9 +60,10 @@ def test_whats_new(mock_session):
 @pytest.mark.skip()
 def test_latest_versions(mock_session):
     got = main.latest_versions(mock_session)
-    assert isinstance(got, list), (
-        'Функция `latest_versions` должна возвращать объект типа `list`'
+    assert inspect.isgenerator(got), (
+        'Функция `latest_versions` должна быть генератором строк результата'
     )
+    got = list(got)
     assert isinstance(got[0], tuple), (
         'Функция `latest_versions` должна вернуть список `result`, '
         'элементами которого должны быть объекты типа `tuple`'
@@ -140,3 +147,260 @@ def test_mode_to_function():
             'В модуле `main.py` в объекте `MODE_TO_FUNCTION` '
             f'нет значения {func}'
         )
+
+
+def pep_pages(statuses):
+    rows = ''.join(
+        f'<tr><td><abbr>{preview}</abbr></td>'
+        f'<td><a href="pep-{number:04d}">{number}</a></td></tr>'
+        for number, (preview, _) in enumerate(statuses, 1)
+    )
+    pages = {
+        main.PEP_URL: (
+            '<section id="index-by-category"><table><tbody>'
+            f'{rows}</tbody></table></section>'
+        )
+    }
+    for number, (_, card_status) in enumerate(statuses, 1):
+        pages[f'{main.PEP_URL}pep-{number:04d}/'] = (
+            f'<dl><dt>Status</dt><dd><abbr>{card_status}</abbr></dd></dl>'
+        )
+    return pages
+
+
+PEP_STATUSES = [
+    ('SF', 'Final'), ('IA', 'Active'), ('SR', 'Rejected'),
+    ('SA', 'Final'), ('PW', 'Withdrawn'), ('SD', 'Deferred'),
+    ('S', 'Draft'), ('SF', 'Final'), ('IF', 'Final'), ('SS', 'Superseded'),
+]
+
+
+def test_pep_workers(pages_session, caplog):
+    pages = pep_pages(PEP_STATUSES)
+    got = {}
+    timings = {}
+    for workers in (1, 10):
+        caplog.clear()
+        session = pages_session(pages, latency=0.05)
+        start = time.perf_counter()
+        results = list(main.pep(session, workers=workers))
+        timings[workers] = time.perf_counter() - start
+        got[workers] = (results, caplog.messages)
+
+    assert got[1] == got[10], (
+        'Результаты и логи режима `pep` не должны зависеть '
+        'от количества потоков'
+    )
+    assert got[1][0] == [
+        ('Статус', 'Количество'),
+        ('Final', 4), ('Active', 1), ('Rejected', 1), ('Withdrawn', 1),
+        ('Deferred', 1), ('Draft', 1), ('Superseded', 1), ('Всего', 10),
+    ]
+    assert len(got[1][1]) == 1, (
+        'Для карточки с несовпадающим статусом должно быть '
+        'одно сообщение в логе'
+    )
+    assert timings[10] < timings[1] / 2, (
+        'Параллельная загрузка карточек PEP должна быть быстрее '
+        'последовательной'
+    )
+
+
+def whats_new_pages(versions):
+    whats_new_url = MAIN_DOC_URL + 'whatsnew/'
+    links = ''.join(
+        f'<li class="toctree-l1"><a href="{version}.html">{version}</a></li>'
+        for version in versions
+    )
+    pages = {
+        whats_new_url: (
+            '<section id="what-s-new-in-python">'
+            f'<div class="toctree-wrapper"><ul>{links}</ul></div></section>'
+        )
+    }
+    for version in versions:
+        pages[f'{whats_new_url}{version}.html'] = (
+            f'<h1>What’s New In Python {version}</h1>'
+            f'<dl><dt>Editor</dt>\n<dd>Author {version}</dd></dl>'
+        )
+    pages[f'{whats_new_url}{versions[-1]}.html'] = '<h1>Broken page</h1>'
+    return pages
+
+
+def test_whats_new_workers(pages_session, caplog):
+    versions = ['3.12', '3.11', '3.10', '3.9', '3.8', '3.7']
+    session = pages_session(whats_new_pages(versions), latency=0.02)
+    got = list(main.whats_new(session, workers=4))
+    assert [row[0] for row in got[1:]] == [
+        f'{MAIN_DOC_URL}whatsnew/{version}.html' for version in versions[:-1]
+    ], (
+        'Функция `whats_new` должна сохранять порядок страниц из оглавления'
+    )
+    assert got[1][1:] == (
+        'What’s New In Python 3.12', 'Editor Author 3.12'
+    )
+    assert len(caplog.messages) == 1 and versions[-1] in caplog.messages[0], (
+        'Ошибки обработки страниц нововведений должны попадать в лог'
+    )
+
+
+@pytest.mark.parametrize('mode, specs', [
+    ('whats-new', ['WHATS_NEW_INDEX_SPEC', 'WHATS_NEW_PAGE_SPEC']),
+    ('latest-versions', ['LATEST_VERSIONS_SPEC']),
+    ('pep', ['PEP_INDEX_SPEC']),
+])
+def test_parse_only_parity(monkeypatch, recorded_session, mode, specs):
+    got = list(main.MODE_TO_FUNCTION[mode](recorded_session))
+    for spec in specs:
+        monkeypatch.setattr(main, spec, None)
+    expected = list(main.MODE_TO_FUNCTION[mode](recorded_session))
+    assert got == expected, (
+        f'Частичный разбор страниц не должен менять результат режима {mode}'
+    )
+
+
+def test_pep_incremental(monkeypatch, tmp_path, pages_session, caplog):
+    monkeypatch.setattr(main, 'BASE_DIR', Path(tmp_path))
+    pages = pep_pages(PEP_STATUSES)
+    session = pages_session(pages)
+    served = []
+
+    def conditional_callback(url, body):
+        def callback(request, context):
+            etag = f'"{len(body)}-{url[-5:-1]}"'
+            context.headers['ETag'] = etag
+            if request.headers.get('If-None-Match') == etag:
+                context.status_code = 304
+                return ''
+            served.append(url)
+            return body
+        return callback
+
+    for url, body in pages.items():
+        if url != main.PEP_URL:
+            session.mock_adapter.register_uri(
+                'GET', url, text=conditional_callback(url, body)
+            )
+
+    first = list(main.pep(session, workers=4, incremental=True))
+    assert len(served) == len(PEP_STATUSES)
+    assert (Path(tmp_path) / 'pep_state.json').exists(), (
+        'Инкрементальный режим должен сохранять состояние карточек'
+    )
+
+    served.clear()
+    changed_url = f'{main.PEP_URL}pep-0002/'
+    pages[changed_url] = '<abbr>Withdrawn</abbr><p>changed</p>'
+    session.mock_adapter.register_uri(
+        'GET', changed_url,
+        text=conditional_callback(changed_url, pages[changed_url])
+    )
+    caplog.clear()
+    second = list(main.pep(session, workers=4, incremental=True))
+    assert served == [changed_url], (
+        'Повторно загружаться должны только изменившиеся карточки'
+    )
+    assert dict(second[1:-1]) == {
+        'Final': 4, 'Withdrawn': 2, 'Rejected': 1,
+        'Deferred': 1, 'Draft': 1, 'Superseded': 1,
+    }, (
+        'Статусы неизменившихся карточек должны браться из состояния'
+    )
+    assert second[-1] == first[-1]
+
+
+def test_download_formats(monkeypatch, tmp_path, recorded_session):
+    monkeypatch.setattr(main, 'BASE_DIR', Path(tmp_path))
+    requested = []
+    formats = {
+        'pdf-a4': 'python-3.12-docs-pdf-a4.zip',
+        'epub': 'python-3.12-docs.epub',
+        'text': 'python-3.12-docs-text.zip',
+    }
+    for archive_format, filename in formats.items():
+        url = f'{MAIN_DOC_URL}archives/{filename}'
+        headers = {'ETag': f'"{archive_format}"'}
+        recorded_session.mock_adapter.register_uri(
+            'GET', url, content=archive_format.encode() * 1000,
+            headers=headers,
+            additional_matcher=lambda request: requested.append(
+                request.url
+            ) or True,
+        )
+        recorded_session.mock_adapter.register_uri(
+            'HEAD', url, headers=headers
+        )
+
+    main.download(recorded_session, workers=3, formats=list(formats))
+    saved = sorted(
+        path.name for path in (Path(tmp_path) / 'downloads').glob('*')
+        if not path.name.endswith('.etag')
+    )
+    assert saved == sorted(formats.values()), (
+        'Режим `download` должен загружать все выбранные форматы'
+    )
+    assert len(requested) == 3
+
+    main.download(recorded_session, workers=3, formats=list(formats))
+    assert len(requested) == 3, (
+        'Уже загруженные архивы с тем же ETag не должны загружаться повторно'
+    )
+
+
+def test_run_modes_batch(monkeypatch, recorded_session):
+    outputs = []
+    monkeypatch.setattr(
+        main, 'control_output',
+        lambda results, cli_args: outputs.append(
+            (cli_args.mode, list(results))
+        )
+    )
+    parser = main.configure_argument_parser(
+        [*main.MODE_TO_FUNCTION, main.MODE_ALL]
+    )
+    args = parser.parse_args(['latest-versions', 'whats-new', '-w', '4'])
+    main.run_modes(recorded_session, args, None)
+    assert [mode for mode, _ in outputs] == ['latest-versions', 'whats-new'], (
+        'Каждый режим пакетного запуска должен выводиться отдельно '
+        'в порядке аргументов'
+    )
+    assert outputs[0][1] == list(main.latest_versions(recorded_session))
+    assert outputs[1][1] == list(main.whats_new(recorded_session))
+
+
+def test_run_modes_incremental_keeps_cache(monkeypatch, tmp_path,
+                                           recorded_session):
+    monkeypatch.setattr(main, 'BASE_DIR', Path(tmp_path))
+    monkeypatch.setattr(main, 'control_output', lambda *args: None)
+    parser = main.configure_argument_parser(
+        [*main.MODE_TO_FUNCTION, main.MODE_ALL]
+    )
+    args = parser.parse_args([
+        'pep', 'latest-versions', 'whats-new', '--incremental', '-w', '4',
+        '--no-pep-index'
+    ])
+    main.run_modes(recorded_session, args, None)
+    cache = recorded_session.cache
+    assert cache.contains(url=MAIN_DOC_URL) and cache.contains(
+        url=MAIN_DOC_URL + 'whatsnew/3.12.html'
+    ), (
+        'Инкрементальный pep не должен отключать HTTP-кеш для режимов, '
+        'выполняющихся одновременно с ним'
+    )
+    assert not cache.contains(url=main.PEP_URL) and not cache.contains(
+        url=main.PEP_URL + 'pep-0001/'
+    ), 'Инкрементальный pep должен запрашивать страницы PEP мимо кеша'
+
+
+def test_pep_index_non_numeric_row(pages_session, caplog):
+    pages = pep_pages(PEP_STATUSES)
+    pages[main.PEP_URL] = pages[main.PEP_URL].replace(
+        '>2</a>', '>PEP two</a>'
+    )
+    got = list(main.pep(pages_session(pages)))
+    assert got[-1] == ('Всего', len(PEP_STATUSES) - 1), (
+        'Строка индекса с нечисловым номером PEP должна пропускаться'
+    )
+    assert any(
+        f'{main.PEP_URL}pep-0002/' in message for message in caplog.messages
+    ), 'Пропущенная строка индекса PEP должна попадать в лог'
@@ -0,0 +1,69 @@
+import json
+import time
+
+import pytest
+
+try:
+    from src import main, metrics, outputs
+except (ModuleNotFoundError, ImportError):
+    assert False, 'Убедитесь что в директории `src` есть файл `metrics.py`'
+
+
+@pytest.fixture
+def enabled_metrics(monkeypatch):
+    monkeypatch.setattr(main.METRICS, 'enabled', True)
+    main.METRICS.reset()
+    yield main.METRICS
+    main.METRICS.reset()
+
+
+def test_timed_self_time():
+    got = metrics.Metrics()
+    got.enabled = True
+    with got.timed('outer'):
+        with got.timed('inner'):
+            time.sleep(0.05)
+    stages = {row[0]: row[1:] for row in got.stage_rows()}
+    assert stages['outer'][0] == stages['inner'][0] == 1
+    assert stages['outer'][2] < stages['inner'][2], (
+        'Собственное время этапа не должно включать вложенные этапы'
+    )
+
+
+def test_disabled_metrics_are_empty():
+    got = metrics.Metrics()
+    with got.timed('stage'):
+        got.count('counter')
+    assert not got.stage_rows() and not got.counter_rows(), (
+        'Выключенный сбор метрик не должен ничего записывать'
+    )
+
+
+def test_pep_metrics(enabled_metrics, recorded_session):
+    list(main.pep(recorded_session))
+    list(main.pep(recorded_session))
+    stages = dict(row[:2] for row in enabled_metrics.stage_rows())
+    counters = dict(enabled_metrics.counter_rows())
+    for stage in ('get_response', 'get_tree', 'select', 'stream_parse'):
+        assert stages.get(stage), f'Этап {stage} должен замеряться'
+    assert counters['http_cache_misses'] == counters['http_cache_hits'], (
+        'Повторный запуск должен брать все страницы из HTTP-кеша'
+    )
+    assert counters['bytes_transferred'] > 0
+
+
+def test_metrics_export(tmp_path, monkeypatch):
+    monkeypatch.setattr(outputs, 'BASE_DIR', tmp_path)
+    enabled_metrics = metrics.Metrics()
+    enabled_metrics.enabled = True
+    with enabled_metrics.timed('stage'):
+        enabled_metrics.count('counter', 3)
+    outputs.metrics_output(enabled_metrics, 'json')
+    outputs.metrics_output(enabled_metrics, 'prometheus')
+    report = json.loads(next(tmp_path.glob('metrics/*.json')).read_text())
+    assert report['counters'] == {'counter': 3}
+    assert report['stages']['stage']['calls'] == 1
+    prometheus = next(tmp_path.glob('metrics/*.prom')).read_text()
+    assert 'parser_events_total{event="counter"} 3' in prometheus, (
+        'Счётчики должны выгружаться в текстовом формате Prometheus'
+    )
@@ -90,3 +90,90 @@ def test_output_file():
     assert hasattr(outputs, 'file_output'), (
         'Напишите функцию `file_output` в модуле `output.py`'
     )
+
+
+def test_file_output_streaming(monkeypatch, tmp_path):
+    monkeypatch.setattr(outputs, 'BASE_DIR', Path(tmp_path))
+    written = []
+
+    def rows():
+        yield ('Статус', 'Количество')
+        yield ('Active', 1)
+        for file in (Path(tmp_path) / 'results').glob('*.csv'):
+            written.append(file.read_text(encoding='utf-8'))
+        yield ('Всего', 1)
+
+    outputs.control_output(rows(), cli_args('pep', 'file'))
+    assert written and 'Active' in written[0], (
+        'Строки должны записываться в файл по мере поступления'
+    )
+
+
+def read_single_file(tmp_path, pattern):
+    files = list((Path(tmp_path) / 'results').glob(pattern))
+    assert len(files) == 1, f'Не найден файл с результатами {pattern}'
+    return files[0]
+
+
+@pytest.mark.parametrize('compression, pattern', [
+    (None, '*.jsonl'),
+    ('gzip', '*.jsonl.gz'),
+])
+def test_control_output_jsonl(monkeypatch, tmp_path, records, compression,
+                              pattern):
+    import gzip
+    import json
+    monkeypatch.setattr(outputs, 'BASE_DIR', Path(tmp_path))
+    monkeypatch.setattr(outputs, 'OUTPUT_BATCH_SIZE', 2)
+    rows = records('pep')
+    cli_arg = Namespace(mode='pep', output='jsonl', compression=compression)
+    outputs.control_output(rows, cli_arg)
+    file = read_single_file(tmp_path, pattern)
+    opener = gzip.open if compression else open
+    with opener(file, 'rt', encoding='utf-8') as f:
+        got = [json.loads(line) for line in f]
+    assert got == [dict(zip(rows[0], row)) for row in rows[1:]], (
+        'Каждая строка JSON Lines должна быть объектом с ключами из заголовка'
+    )
+
+
+@pytest.mark.parametrize('output', ['arrow', 'parquet'])
+def test_control_output_columnar(monkeypatch, tmp_path, output):
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+    monkeypatch.setattr(outputs, 'BASE_DIR', Path(tmp_path))
+    monkeypatch.setattr(outputs, 'OUTPUT_BATCH_SIZE', 2)
+    rows = [('Статус', 'Количество'), ('Active', 36), ('Final', 15),
+            ('Withdrawn', 51), ('Всего', 102)]
+    outputs.control_output(
+        iter(rows), Namespace(mode='pep', output=output, compression='zstd')
+    )
+    file = read_single_file(tmp_path, f'*.{output}')
+    if output == 'arrow':
+        table = pa.ipc.open_file(str(file)).read_all()
+    else:
+        table = pq.read_table(str(file))
+    assert table.column_names == list(rows[0])
+    assert table.num_rows == len(rows) - 1
+    assert table.column('Количество').type == pa.int64(), (
+        'Числовые столбцы должны сохранять тип'
+    )
+
+
+@pytest.mark.parametrize('output', ['arrow', 'parquet'])
+def test_control_output_columnar_header_only(monkeypatch, tmp_path, output):
+    pa = pytest.importorskip('pyarrow')
+    import pyarrow.parquet as pq
+    monkeypatch.setattr(outputs, 'BASE_DIR', Path(tmp_path))
+    header = ('Номер', 'Ссылка')
+    outputs.control_output(
+        iter([header]), Namespace(mode='pep', output=output, compression=None)
+    )
+    file = read_single_file(tmp_path, f'*.{output}')
+    if output == 'arrow':
+        table = pa.ipc.open_file(str(file)).read_all()
+    else:
+        table = pq.read_table(str(file))
+    assert table.column_names == list(header) and table.num_rows == 0, (
+        'Результат из одного заголовка должен сохраняться пустой таблицей'
+    )
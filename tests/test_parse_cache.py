@@ -0,0 +1,110 @@
+import io
+
+import pytest
+from requests import Response
+try:
+    from src import main, parse_cache
+except (ModuleNotFoundError, ImportError):
+    assert False, 'Убедитесь что в директории `src` есть файл `parse_cache.py`'
+
+
+def make_response(url, body, headers=None):
+    response = Response()
+    response.url = url
+    response._content = body.encode()
+    response.headers.update(headers or {})
+    return response
+
+
+def parse_length(response):
+    parse_length.calls += 1
+    return len(response.content)
+
+
+def test_parse_cache_hit_and_invalidation(tmp_path):
+    parse_length.calls = 0
+    cache = parse_cache.ParseCache(tmp_path / 'cache.pickle', 10)
+    assert cache.get_or_parse(make_response('u', 'abc'), parse_length) == 3
+    assert cache.get_or_parse(make_response('u', 'abc'), parse_length) == 3
+    assert parse_length.calls == 1, (
+        'Повторный разбор неизменившегося ответа должен браться из кеша'
+    )
+    assert cache.get_or_parse(make_response('u', 'abcd'), parse_length) == 4
+    assert parse_length.calls == 2, (
+        'Запись кеша должна сбрасываться при изменении ответа'
+    )
+
+
+def test_parse_cache_etag_and_persistence(tmp_path):
+    parse_length.calls = 0
+    path = tmp_path / 'cache.pickle'
+    cache = parse_cache.ParseCache(path, 10)
+    cache.get_or_parse(
+        make_response('u', 'abc', {'ETag': '"1"'}), parse_length
+    )
+    cache.save()
+    cache = parse_cache.ParseCache(path, 10)
+    got = cache.get_or_parse(
+        make_response('u', 'changed body', {'ETag': '"1"'}), parse_length
+    )
+    assert got == 3 and parse_length.calls == 1, (
+        'Отпечаток ответа должен строиться по ETag и переживать перезапуск'
+    )
+
+
+def test_parse_cache_lru_eviction(tmp_path):
+    cache = parse_cache.ParseCache(tmp_path / 'cache.pickle', 2)
+    for url in ('a', 'b', 'a', 'c'):
+        cache.get_or_parse(make_response(url, url), parse_length)
+    assert [url for _, url in cache.entries] == ['a', 'c'], (
+        'При переполнении должна вытесняться давно не использованная запись'
+    )
+
+
+def test_parse_cache_negative_size(tmp_path):
+    cache = parse_cache.ParseCache(tmp_path / 'cache.pickle', -1)
+    assert cache.get_or_parse(make_response('u', 'abc'), parse_length) == 3
+    assert not cache.entries, (
+        'Вытеснение не должно падать на пустом кеше'
+    )
+
+
+def test_parse_cache_streamed_response(tmp_path):
+    response = Response()
+    response.url = 'u'
+    response.raw = io.BytesIO(b'abc')
+    cache = parse_cache.ParseCache(tmp_path / 'cache.pickle', 10)
+    got = cache.get_or_parse(response, lambda response: response.raw.read(1))
+    assert got == b'a' and response._content is False, (
+        'Отпечаток потокового ответа не должен читать тело целиком'
+    )
+    assert not cache.entries
+
+
+def test_pep_warm_run(tmp_path, recorded_session):
+    cache = parse_cache.ParseCache(tmp_path / 'cache.pickle', 4096)
+    cold = list(main.pep(recorded_session, workers=4, parse_cache=cache))
+    cold_misses = cache.misses
+    warm = list(main.pep(recorded_session, workers=4, parse_cache=cache))
+    assert warm == cold
+    assert cache.misses == cold_misses and cache.hits == cold_misses, (
+        'Повторный запуск `pep` не должен заново разбирать страницы'
+    )
+
+
+@pytest.mark.parametrize('stale_pickle', [
+    b'cno_such_module\nThing\n.', b'cos\nNoSuchThing\n.'
+])
+def test_parse_cache_stale_pickle(tmp_path, stale_pickle):
+    path = tmp_path / 'cache.pickle'
+    path.write_bytes(stale_pickle)
+    cache = parse_cache.ParseCache(path, 10)
+    assert not cache.entries, (
+        'Файл кеша от старой версии кода должен отбрасываться при загрузке'
+    )
+    cache.get_or_parse(make_response('u', 'abc'), parse_length)
+    cache.save()
+    assert len(parse_cache.ParseCache(path, 10).entries) == 1
+    assert list(tmp_path.iterdir()) == [path], (
+        'Кеш должен сохраняться через временный файл с переименованием'
+    )
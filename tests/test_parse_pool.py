@@ -0,0 +1,65 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+try:
+    from src import main, parse_cache, parse_pool
+except (ModuleNotFoundError, ImportError):
+    assert False, 'Убедитесь что в директории `src` есть файл `parse_pool.py`'
+
+
+@pytest.fixture(scope='module')
+def process_pool():
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+@pytest.mark.parametrize('mode', ['whats-new', 'latest-versions', 'pep'])
+def test_parse_pool_parity(pages_session, process_pool, mode):
+    from tests.fixture_data.recorded import recorded_pages
+    pages = recorded_pages()
+    expected = list(main.MODE_TO_FUNCTION[mode](pages_session(pages)))
+    got = list(main.MODE_TO_FUNCTION[mode](
+        pages_session(pages), workers=4, parse_pool=process_pool
+    ))
+    assert got == expected, (
+        f'Разбор в пуле процессов не должен менять результат режима `{mode}`'
+    )
+
+
+def test_parse_pool_with_cache(recorded_session, process_pool, tmp_path):
+    cache = parse_cache.ParseCache(tmp_path / 'cache.pickle', 1000)
+    for _ in range(2):
+        got = list(main.pep(
+            recorded_session, parse_cache=cache, parse_pool=process_pool
+        ))
+    assert got[-1][0] == 'Всего' and cache.hits, (
+        'Результаты разбора в пуле процессов должны сохраняться в кеше'
+    )
+
+
+def test_parse_body():
+    got = parse_pool.parse_body(
+        main.extract_pep_card_status,
+        'https://peps.python.org/pep-0001/',
+        '<dl><dd><abbr>Active</abbr></dd></dl>'.encode(),
+        'utf-8'
+    )
+    assert got == 'Active'
+
+
+def test_pep_cards_stream_outside_pool(recorded_session):
+    from concurrent.futures import ThreadPoolExecutor
+    submitted = []
+
+    class RecordingPool(ThreadPoolExecutor):
+        def submit(self, fn, parse, *args):
+            submitted.append(getattr(parse, 'func', parse).__name__)
+            return super().submit(fn, parse, *args)
+
+    with RecordingPool(max_workers=2) as pool:
+        list(main.pep(recorded_session, workers=4, parse_pool=pool))
+    assert submitted == ['extract_pep_index'], (
+        'Карточки PEP должны разбираться потоково в потоках загрузки, '
+        'а не передаваться в пул процессов целиком'
+    )
@@ -0,0 +1,57 @@
+from pathlib import Path
+
+try:
+    from src import main, pep_index
+except (ModuleNotFoundError, ImportError):
+    assert False, 'Убедитесь что в директории `src` есть файл `pep_index.py`'
+
+
+def test_pep_index_queries(monkeypatch, tmp_path, recorded_session, caplog):
+    monkeypatch.setattr(main, 'BASE_DIR', Path(tmp_path))
+    results = list(main.pep(recorded_session, workers=4, pep_index=True))
+    mismatches = [
+        message for message in caplog.messages
+        if 'Несовпадающие статусы' in message
+    ]
+
+    counts = list(main.pep(None, query='counts'))
+    assert counts[0] == pep_index.COUNTS_HEADER
+    assert sum(row[2] for row in counts[1:]) == results[-1][1], (
+        'Количество PEP в индексе должно совпадать с итогом режима `pep`'
+    )
+    mismatched = list(main.pep(None, query='mismatched'))
+    assert mismatched[0] == pep_index.MISMATCHED_HEADER
+    assert len(mismatched) - 1 == len(mismatches), (
+        'Запрос mismatched должен находить все PEP с несовпадающим статусом'
+    )
+    number, url, pep_type, index_status, card_status, category = (
+        mismatched[1]
+    )
+    assert url.endswith(f'pep-{number:04d}/') and category, (
+        'В индексе должны храниться номер, ссылка и категория PEP'
+    )
+    assert card_status not in main.EXPECTED_STATUS[index_status]
+
+
+def test_pep_index_incremental_update(tmp_path):
+    path = tmp_path / 'index.sqlite3'
+    records = [
+        (1, 'https://peps.python.org/pep-0001/', 'P', 'A', 'Active', 'Meta'),
+        (2, 'https://peps.python.org/pep-0002/', 'S', 'F', 'Final', 'Final'),
+        (3, 'https://peps.python.org/pep-0003/', 'S', 'D', 'Draft', 'Open'),
+    ]
+    with pep_index.PepIndex(path, main.EXPECTED_STATUS) as index:
+        assert index.update(records) == 3
+        assert index.update(records) == 0, (
+            'Неизменившиеся записи не должны перезаписываться'
+        )
+        changed = [
+            records[0][:4] + (None, 'Meta'),
+            records[1][:4] + ('Rejected', 'Final'),
+        ]
+        assert index.update(changed) == 2, (
+            'Должны обновляться изменившиеся записи и удаляться пропавшие'
+        )
+    with pep_index.PepIndex(path, main.EXPECTED_STATUS) as index:
+        assert index.counts()[1:] == [('Active', 'P', 1), ('Rejected', 'S', 1)]
+        assert [row[0] for row in index.mismatched()[1:]] == [2]
@@ -0,0 +1,18 @@
+try:
+    from src import pep_state
+except (ModuleNotFoundError, ImportError):
+    assert False, 'Убедитесь что в директории `src` есть файл `pep_state.py`'
+
+
+def test_pep_state_save(tmp_path):
+    path = tmp_path / 'pep_state.json'
+    path.write_text('{"u": {"status": "Draft"}}', encoding='utf-8')
+    state = pep_state.PepState(path)
+    state.update('u', 'Final', {'ETag': '"1"'})
+    state.save()
+    assert list(tmp_path.iterdir()) == [path], (
+        'Состояние должно сохраняться через временный файл с переименованием'
+    )
+    state = pep_state.PepState(path)
+    assert state.cards['u']['status'] == 'Final'
+    assert state.conditional_headers('u') == {'If-None-Match': '"1"'}
@@ -0,0 +1,74 @@
+try:
+    from src import main, pep_table, records
+except (ModuleNotFoundError, ImportError):
+    assert False, 'Убедитесь что в директории `src` есть файл `pep_table.py`'
+
+
+def make_table():
+    table = pep_table.PepTable()
+    for number, index_status, card_status, category in [
+        (1, 'A', 'Active', 'Meta'),
+        (2, 'F', 'Final', 'Final'),
+        (3, 'F', 'Rejected', 'Final'),
+        (4, 'F', None, 'Final'),
+        (5, 'A', 'Active', 'Meta'),
+    ]:
+        table.append(records.PepRecord(
+            url=f'pep-{number}',
+            expected_status=main.EXPECTED_STATUS[index_status],
+            number=number,
+            type='S',
+            index_status=index_status,
+            category=category,
+        ), card_status)
+    return table
+
+
+def test_pep_table_reports():
+    table = make_table()
+    assert len(table) == 5
+    assert table.statuses() == [
+        ('Статус', 'Количество'),
+        ('Active', 2), ('Final', 1), ('Rejected', 1), ('Всего', 4),
+    ], 'Карточки с ошибкой загрузки не должны попадать в отчёт'
+    assert table.confusion()[1:] == [
+        ('A', 'Active', 2, True),
+        ('F', 'Final', 1, True),
+        ('F', 'Rejected', 1, False),
+    ]
+    assert table.categories()[1:] == [
+        ('Meta', 'Active', 2), ('Final', 'Final', 1),
+        ('Final', 'Rejected', 1),
+    ]
+    assert table.mismatched() == [('pep-3', 'Rejected', ('Final',))]
+    assert table.records()[3] == (4, 'pep-4', 'S', 'F', None, 'Final')
+
+
+def test_pep_reports_agree(recorded_session):
+    totals = {}
+    for report in ('statuses', 'confusion', 'categories'):
+        rows = list(main.pep(recorded_session, workers=4, report=report))
+        counts = [row[1] if report == 'statuses' else row[2]
+                  for row in rows[1:]]
+        totals[report] = counts[-1] if report == 'statuses' else sum(counts)
+    assert len(set(totals.values())) == 1, (
+        'Все отчёты режима `pep` должны учитывать одни и те же карточки'
+    )
+
+
+def test_pep_table_shared_columns():
+    table = make_table()
+    table.statuses()
+    combinations = table.combinations
+    table.confusion()
+    table.categories()
+    assert table.combinations is combinations, (
+        'Счётчик сочетаний должен считаться один раз для всех отчётов'
+    )
+    table.append(records.PepRecord(
+        url='pep-6', expected_status=('Final',), number=6, type='S',
+        index_status='F', category='Final'
+    ), 'Final')
+    assert table.statuses()[-1] == ('Всего', 5), (
+        'Добавление строки должно сбрасывать посчитанные столбцы'
+    )
@@ -0,0 +1,84 @@
+import pstats
+import threading
+from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from src import main, outputs, profiling
+except (ModuleNotFoundError, ImportError):
+    assert False, 'Убедитесь что в директории `src` есть файл `profiling.py`'
+
+
+def test_profile_call_threads(recorded_session):
+    stats = profiling.profile_call(
+        lambda: list(main.pep(recorded_session, workers=4))
+    )
+    functions = {key[2] for key in stats.stats}
+    assert 'find_tag_in_stream' in functions, (
+        'Профиль должен включать функции, выполненные в потоках пула'
+    )
+    subsystems = {row[0] for row in profiling.subsystem_rows(stats)}
+    assert {'HTTP', 'кеш', 'разбор', 'выборка'} <= subsystems, (
+        'Сводка профиля должна группировать функции по подсистемам'
+    )
+
+
+def pool_task(number):
+    return sum(range(number))
+
+
+def run_in_pool():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        return list(executor.map(pool_task, range(100)))
+
+
+def test_profile_call_thread_pool():
+    stats = profiling.profile_call(run_in_pool)
+    functions = {key[2] for key in stats.stats}
+    assert 'pool_task' in functions, (
+        'Профиль должен включать функции, выполненные в пуле потоков'
+    )
+
+
+def test_profile_call_thread_profile_unavailable(monkeypatch):
+    class MainThreadProfile(profiling.cProfile.Profile):
+        def enable(self, *args, **kwargs):
+            if threading.current_thread() is not threading.main_thread():
+                raise ValueError('Another profiling tool is already active')
+            super().enable(*args, **kwargs)
+
+    monkeypatch.setattr(profiling, 'PROCESS_WIDE_PROFILE', False)
+    monkeypatch.setattr(profiling.cProfile, 'Profile', MainThreadProfile)
+    stats = profiling.profile_call(run_in_pool)
+    functions = {key[2] for key in stats.stats}
+    assert 'run_in_pool' in functions, (
+        'Если профайлер потока не включается, поток должен пропускаться'
+    )
+
+
+def test_subsystem():
+    assert profiling.subsystem(
+        ('/src/utils.py', 1, 'get_response')
+    ) == 'HTTP'
+    assert profiling.subsystem(
+        ('/src/utils.py', 1, 'find_tag')
+    ) == 'выборка'
+    assert profiling.subsystem(
+        ('/src/utils.py', 1, 'find_tag_in_stream')
+    ) == 'разбор'
+    assert profiling.subsystem(
+        ('/site-packages/prettytable/prettytable.py', 1, 'get_string')
+    ) == 'вывод'
+
+
+def test_profile_output(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(outputs, 'BASE_DIR', tmp_path)
+    stats = profiling.profile_call(sorted, range(10))
+    outputs.profile_output(
+        stats, Namespace(mode=['pep'], profile_top=3)
+    )
+    file_path = next(tmp_path.glob('profiles/pep_*.prof'))
+    assert pstats.Stats(str(file_path)).stats, (
+        'Статистика профиля должна сохраняться в формате pstats'
+    )
+    assert 'Подсистема' in capsys.readouterr().out
@@ -0,0 +1,41 @@
+import pytest
+
+try:
+    from src import main
+except (ModuleNotFoundError, ImportError):
+    assert False, 'Убедитесь что в директории `src` есть файл `main.py`'
+
+
+@pytest.mark.parametrize('mode, record', [
+    ('whats-new', 'WhatsNewRow'),
+    ('latest-versions', 'VersionRow'),
+    ('pep', 'StatusRow'),
+])
+@pytest.mark.parametrize('backend', list(main.BACKENDS))
+def test_mode_records(recorded_session, mode, record, backend):
+    header, *rows = main.MODE_TO_FUNCTION[mode](
+        recorded_session, workers=4, backend=main.BACKENDS[backend]
+    )
+    assert type(header) is tuple
+    assert rows and all(type(row).__name__ == record for row in rows), (
+        f'Строки режима `{mode}` должны быть записями {record}'
+    )
+    for row in rows:
+        assert len(row) == len(header)
+        assert all(
+            type(value) in (str, int) for value in row
+        ), (
+            'Текст в строках результата должен быть обычной строкой `str`, '
+            'не связанной с деревом разбора'
+        )
+
+
+def test_pep_index_records(recorded_session):
+    response = main.get_response(recorded_session, main.PEP_URL)
+    for backend in main.BACKENDS.values():
+        records = main.extract_pep_index(response, backend)
+        assert all(
+            type(record).__name__ == 'PepRecord'
+            and type(record.url) is str and type(record.category) is str
+            for record in records
+        )
@@ -0,0 +1,78 @@
+import json
+from threading import Thread
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+try:
+    from src import server
+except (ModuleNotFoundError, ImportError):
+    assert False, 'Убедитесь что в директории `src` есть файл `server.py`'
+
+
+@pytest.fixture
+def snapshot_server():
+    calls = []
+
+    def refresh(mode):
+        calls.append(mode)
+        if mode == 'download':
+            return None
+        return [('Статус', 'Количество'), ('Final', len(calls))]
+
+    snapshot_server = server.SnapshotServer(
+        ('127.0.0.1', 0), refresh, ['pep', 'download'], 3600
+    )
+    thread = Thread(target=snapshot_server.serve_forever, daemon=True)
+    thread.start()
+    snapshot_server.calls = calls
+    yield snapshot_server
+    snapshot_server.shutdown()
+    snapshot_server.server_close()
+
+
+def get_json(snapshot_server, path):
+    port = snapshot_server.server_address[1]
+    with urlopen(f'http://127.0.0.1:{port}{path}') as response:
+        return json.load(response)
+
+
+def test_snapshot_server(snapshot_server):
+    with pytest.raises(HTTPError) as excinfo:
+        get_json(snapshot_server, '/pep')
+    assert excinfo.value.code == 503, (
+        'До первого обновления сервер должен отвечать 503'
+    )
+
+    snapshot_server.start_refresh()
+    assert snapshot_server.refreshed.wait(5)
+    got = get_json(snapshot_server, '/pep?format=json')
+    assert got['header'] == ['Статус', 'Количество']
+    assert got['rows'] == [['Final', 1]]
+    assert list(get_json(snapshot_server, '/')) == ['pep']
+
+    get_json(snapshot_server, '/pep')
+    assert snapshot_server.calls == ['pep', 'download'], (
+        'Запросы должны обслуживаться из снимка без повторного парсинга'
+    )
+    with pytest.raises(HTTPError) as excinfo:
+        get_json(snapshot_server, '/unknown')
+    assert excinfo.value.code == 404
+
+
+def test_serve_skips_rowless_modes(monkeypatch):
+    import server as top_level_server
+
+    from src import main
+    served = []
+    monkeypatch.setattr(
+        top_level_server, 'serve',
+        lambda refresh, modes, *args: served.extend(modes)
+    )
+    parser = main.configure_argument_parser(
+        [*main.MODE_TO_FUNCTION, main.MODE_ALL]
+    )
+    main.run(None, parser.parse_args(['all', '--serve']), None)
+    assert served == ['whats-new', 'latest-versions', 'pep'], (
+        'Режим download не возвращает строк и не должен обслуживаться сервером'
+    )
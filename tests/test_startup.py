@@ -0,0 +1,37 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+HEAVY_MODULES = ('bs4', 'lxml', 'requests_cache', 'prettytable', 'requests')
+
+
+def loaded_modules(code):
+    completed = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+    return set(completed.stdout.splitlines()[-1].split()[1:])
+
+
+@pytest.mark.parametrize('code', [
+    'import main',
+    'import main, sys\n'
+    'sys.argv = ["main.py", "-h"]\n'
+    'try:\n'
+    '    main.main()\n'
+    'except SystemExit:\n'
+    '    pass',
+])
+def test_lazy_imports(code):
+    got = loaded_modules(
+        code + '\nimport sys\n'
+        f'print("loaded:", *(m for m in {HEAVY_MODULES!r} '
+        'if m in sys.modules))'
+    )
+    assert not got, (
+        'Импорт `main.py` и вывод справки не должны загружать '
+        f'тяжёлые зависимости: {", ".join(sorted(got))}'
+    )
@@ -0,0 +1,44 @@
+import time
+
+import pytest
+from requests import Request
+from requests.adapters import HTTPAdapter
+try:
+    from src import transport
+except (ModuleNotFoundError, ImportError):
+    assert False, 'Убедитесь что в директории `src` есть файл `transport.py`'
+
+
+def test_token_bucket_rate():
+    bucket = transport.TokenBucket(rate=50, capacity=1)
+    start = time.monotonic()
+    for _ in range(11):
+        bucket.acquire()
+    assert time.monotonic() - start == pytest.approx(0.2, abs=0.1), (
+        'Частота операций должна ограничиваться скоростью пополнения'
+    )
+
+
+def test_rate_limited_adapter(monkeypatch):
+    sent = []
+
+    def fake_send(self, request, timeout=None, **kwargs):
+        sent.append((request.url, timeout, time.monotonic()))
+
+    monkeypatch.setattr(HTTPAdapter, 'send', fake_send)
+    adapter = transport.RateLimitedAdapter(
+        pool_size=8, timeout=5, retries=2, rate_limit=20
+    )
+    for url in ['https://a.org/1', 'https://b.org/1'] * 23:
+        adapter.send(Request('GET', url).prepare())
+    adapter.send(Request('GET', 'https://a.org/2').prepare(), timeout=1)
+
+    assert adapter.max_retries.total == 2
+    assert adapter._pool_maxsize == 8, (
+        'Размер пула соединений должен совпадать с числом потоков'
+    )
+    assert [timeout for _, timeout, _ in sent] == [5] * 46 + [1]
+    a_times = [sent_at for url, _, sent_at in sent if 'a.org' in url]
+    assert a_times[-1] - a_times[0] >= 0.15, (
+        'Запросы к одному хосту должны ограничиваться по частоте'
+    )
@@ -54,3 +54,102 @@ def test_get_response(mock_session):
             'делает запрос к странице и возвращает ответ. \n'
             'Кстати: You are breathtaken!'
         )
+
+
+class StreamedResponse:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.read_chunks = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def iter_content(self, chunk_size):
+        for chunk in self.chunks:
+            self.read_chunks += 1
+            yield chunk
+
+
+class StreamedSession:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url, **kwargs):
+        assert kwargs.get('stream'), (
+            'Карточка PEP должна загружаться потоково (`stream=True`)'
+        )
+        return self.response
+
+
+def test_find_tag_streamed_stops_early():
+    chunks = [
+        '<html><body><dl><dt>Status</dt>'.encode(),
+        '<dd><abbr title="Accepted">Final</abbr></dd>'.encode(),
+        *[b'<p>' + b'tail ' * 1000 + b'</p>'] * 10,
+    ]
+    response = StreamedResponse(chunks)
+    got = utils.find_tag_streamed(
+        StreamedSession(response), MAIN_DOC_URL, 'abbr'
+    )
+    assert got == 'Final'
+    assert response.read_chunks < len(chunks), (
+        'Чтение ответа должно прекращаться, как только найден искомый тег'
+    )
+
+
+def test_find_tag_streamed_exception():
+    response = StreamedResponse([b'<html><body><p>No status</p>'])
+    with pytest.raises(utils.ParserFindTagException):
+        utils.find_tag_streamed(
+            StreamedSession(response), MAIN_DOC_URL, 'abbr'
+        )
+
+
+def test_find_tag_streamed_parity(recorded_session):
+    from tests.fixture_data.recorded import PAGES_DIR, PEP_URL
+    for card in PAGES_DIR.glob('pep-*.html'):
+        url = f'{PEP_URL}{card.stem}/'
+        soup = utils.get_soup(recorded_session, url)
+        assert utils.find_tag_streamed(recorded_session, url, 'abbr') == (
+            utils.find_tag(soup, 'abbr').text
+        ), f'Потоковый разбор карточки {card.name} расходится с bs4'
+
+
+def page_selectors():
+    from src import main
+    return [
+        ('whatsnew_index.html', main.WHATS_NEW_LINKS),
+        *(('download.html', selector)
+          for selector in main.DOWNLOAD_LINKS.values()),
+        ('pep_index.html', main.PEP_INDEX_ROWS),
+    ]
+
+
+@pytest.mark.parametrize('page, selector', page_selectors())
+def test_selector_parity(page, selector):
+    from tests.fixture_data.recorded import PAGES_DIR
+    text = (PAGES_DIR / page).read_text(encoding='utf-8')
+    from_soup, from_tree = (
+        [
+            (tag.get('href'), utils.node_text(tag))
+            for tag in utils.select(root, selector)
+        ]
+        for root in (utils.make_soup(text), utils.make_tree(text))
+    )
+    assert from_soup and from_soup == from_tree, (
+        f'Селектор {selector.css} должен давать одинаковый результат '
+        'на супе BeautifulSoup и на дереве lxml'
+    )
+
+
+def test_select_tag_exception():
+    tree = utils.make_tree('<html><body><p>text</p></body></html>')
+    with pytest.raises(BaseException) as excinfo:
+        utils.select_tag(tree, utils.Selector('abbr', './/abbr'))
+    assert excinfo.typename == 'ParserFindTagException', (
+        'Функция `select_tag` должна выбрасывать ParserFindTagException, '
+        'если тег не найден'
+    )